@@ -0,0 +1,268 @@
+"""
+Benchmark suite for strategies and the match engine.
+
+Measures per-call cost of each strategy's reset/act/on_result and the
+engine's per-round cost over a grid of N and rounds, fits the empirical
+scaling exponent (time ~ N^k), and stores / compares baseline files.
+
+    python benchmark.py --save bench_baseline.json
+    python benchmark.py --compare bench_baseline.json --threshold 0.25
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from shared.history import make_history
+from shared.match import IteratedMatch, MatchConfig
+from shared.strategy_base import history_window
+from shared.types import ReusableMatchResult, ReusableObservation
+from strategy_registry import registry
+from tournament_core import DEFAULT_POOL
+
+DEFAULT_NS = [10, 100, 1000, 10000]
+DEFAULT_ROUNDS = [1000, 10000]
+
+# Only compare cells slower than this; tinier timings are mostly noise.
+MIN_COMPARABLE_US = 0.05
+
+# Resets averaged for the warm reset cost
+WARM_RESETS = 5
+
+
+def clear_caches(cls) -> None:
+    """
+    Empty the functools caches in the module defining `cls` (tables some
+    strategies build once per N and share across instances), so the next
+    reset pays their full cost.
+    """
+    for obj in list(vars(sys.modules[cls.__module__]).values()):
+        if callable(getattr(obj, "cache_clear", None)):
+            obj.cache_clear()
+
+
+def bench_strategy(cls, N: int, rounds: int, seed: int = 0) -> Dict[str, float]:
+    """
+    Drive one strategy alone against uniformly random opponent bids and
+    return microseconds per call of reset, act and on_result.
+
+    "reset" is the cold cost, with the module's caches cleared first;
+    "reset_warm" averages WARM_RESETS further resets at the same N.
+    Tables built lazily on the first move are likewise paid in "act", so
+    no cell depends on which cells ran before it.
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    s = cls()
+    window = history_window(s)
+    mine, theirs = make_history(window), make_history(window)
+    obs = ReusableObservation(N, 0, s.name, "bench", (), ())
+    res = ReusableMatchResult(N, 0, s.name, "bench", 0, 0, 0, 0)
+    clock = time.perf_counter
+    act, on_result = s.act, s.on_result
+
+    clear_caches(cls)
+    t0 = clock()
+    s.reset(N=N)
+    reset_time = clock() - t0
+    t0 = clock()
+    for _ in range(WARM_RESETS):
+        s.reset(N=N)
+    warm_time = (clock() - t0) / WARM_RESETS
+
+    act_time = 0.0
+    result_time = 0.0
+    for t in range(1, rounds + 1):
+        obs.t = t
+        if window != 0:
+            obs.opp_action_history = theirs.view(window)
+            obs.self_action_history = mine.view(window)
+        t0 = clock()
+        a = act(obs)
+        t1 = clock()
+        act_time += t1 - t0
+
+        b = rng.randint(1, N)
+        mine.append(a)
+        theirs.append(b)
+        res.t = t
+        res.self_action, res.opp_action = a, b
+        res.self_payoff = a if a < b else 0
+        res.opp_payoff = b if b < a else 0
+        t0 = clock()
+        on_result(res)
+        result_time += clock() - t0
+
+    return {
+        "reset": 1e6 * reset_time,
+        "reset_warm": 1e6 * warm_time,
+        "act": 1e6 * act_time / rounds,
+        "on_result": 1e6 * result_time / rounds,
+    }
+
+
+class _Constant:
+    """
+    Trivial strategy that reads its full history, so the engine's own
+    bookkeeping dominates the measurement.
+    """
+    name = "Constant"
+
+    def reset(self, *, N: int) -> None:
+        self.N = N
+
+    def act(self, obs) -> int:
+        return len(obs.opp_action_history) % self.N + 1
+
+    def on_result(self, result) -> None:
+        pass
+
+
+def bench_engine(N: int, rounds: int, fast: bool) -> Dict[str, float]:
+    """
+    Microseconds per round of IteratedMatch between two trivial strategies.
+    """
+    cfg = MatchConfig(N=N, rounds=rounds, verbose=False, fast=fast)
+    t0 = time.perf_counter()
+    IteratedMatch(_Constant(), _Constant(), cfg).run()
+    return {"round": 1e6 * (time.perf_counter() - t0) / rounds}
+
+
+def _cell(N: int, rounds: int) -> str:
+    return f"N={N},rounds={rounds}"
+
+
+def run_suite(Ns: Sequence[int], rounds_list: Sequence[int], repeat: int = 3,
+              only: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    results[subject][metric][cell] = best-of-`repeat` microseconds.
+    """
+    entries = registry().select(*DEFAULT_POOL, "RandomBid")
+    if only:  # import only the strategies being measured
+        entries = [e for e in entries if e.name in only]
+    classes = [e.load() for e in entries]
+    subjects = [(cls.name, lambda N, r, cls=cls: bench_strategy(cls, N, r)) for cls in classes]
+    subjects += [
+        ("engine", lambda N, r: bench_engine(N, r, fast=False)),
+        ("engine[fast]", lambda N, r: bench_engine(N, r, fast=True)),
+    ]
+    if only:
+        subjects = [(name, fn) for name, fn in subjects if name in only]
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name, fn in subjects:
+        metrics: Dict[str, Dict[str, float]] = {}
+        for N in Ns:
+            for rounds in rounds_list:
+                best: Dict[str, float] = {}
+                for _ in range(repeat):
+                    for metric, us in fn(N, rounds).items():
+                        best[metric] = min(us, best.get(metric, math.inf))
+                for metric, us in best.items():
+                    metrics.setdefault(metric, {})[_cell(N, rounds)] = us
+                print(f"  {name:<14} {_cell(N, rounds):<22} "
+                      + "  ".join(f"{m}={us:.3f}us" for m, us in best.items()), file=sys.stderr)
+        results[name] = metrics
+    return results
+
+
+def fit_exponent(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """
+    Least-squares slope of log(y) against log(x): y ~ x^k.
+    """
+    pts = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(pts) < 2:
+        return float("nan")
+    mx = sum(p[0] for p in pts) / len(pts)
+    my = sum(p[1] for p in pts) / len(pts)
+    sxx = sum((p[0] - mx) ** 2 for p in pts)
+    sxy = sum((p[0] - mx) * (p[1] - my) for p in pts)
+    return sxy / sxx if sxx else float("nan")
+
+
+def scaling(results, Ns: Sequence[int], rounds_list: Sequence[int]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Per subject and metric: exponent in N (at the largest rounds) and in
+    rounds (at the largest N). 0 means constant per call, 1 linear, ...
+    """
+    out: Dict[str, Dict[str, Dict[str, float]]] = {}
+    r_max, n_max = max(rounds_list), max(Ns)
+    for name, metrics in results.items():
+        for metric, cells in metrics.items():
+            out.setdefault(name, {})[metric] = {
+                "N": fit_exponent(Ns, [cells[_cell(N, r_max)] for N in Ns]),
+                "rounds": fit_exponent(rounds_list, [cells[_cell(n_max, r)] for r in rounds_list]),
+            }
+    return out
+
+
+def compare(results, baseline, threshold: float) -> List[Tuple[str, str, str, float, float]]:
+    """
+    Cells that got slower than baseline by more than `threshold`
+    (0.25 = 25%): (subject, metric, cell, baseline_us, new_us).
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, cells in metrics.items():
+            old_cells = baseline.get(name, {}).get(metric, {})
+            for cell, us in cells.items():
+                old = old_cells.get(cell)
+                if old is None or max(old, us) < MIN_COMPARABLE_US:
+                    continue
+                if us > old * (1 + threshold):
+                    regressions.append((name, metric, cell, old, us))
+    return regressions
+
+
+def print_scaling(scal) -> None:
+    print("\n=== Empirical scaling (time per call ~ N^kN, rounds^kR) ===")
+    print(f"{'Subject':<14} {'Metric':<10} {'kN':>6} {'kR':>6}")
+    for name, metrics in scal.items():
+        for metric, k in metrics.items():
+            print(f"{name:<14} {metric:<10} {k['N']:>6.2f} {k['rounds']:>6.2f}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--N", type=int, nargs="+", default=DEFAULT_NS)
+    p.add_argument("--rounds", type=int, nargs="+", default=DEFAULT_ROUNDS)
+    p.add_argument("--repeat", type=int, default=3, help="best-of repeats per cell")
+    p.add_argument("--only", nargs="+", help="subjects to run (strategy names, engine, engine[fast])")
+    p.add_argument("--save", help="write results as a baseline JSON file")
+    p.add_argument("--compare", help="baseline JSON file to compare against")
+    p.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    args = p.parse_args(argv)
+
+    results = run_suite(args.N, args.rounds, args.repeat, args.only)
+    scal = scaling(results, args.N, args.rounds)
+    print_scaling(scal)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "meta": {"python": platform.python_version(), "machine": platform.machine(),
+                         "Ns": args.N, "rounds": args.rounds},
+                "results": results,
+                "scaling": scal,
+            }, f, indent=2, sort_keys=True)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n=== Regressions (> {100 * args.threshold:.0f}% slower) ===")
+            for name, metric, cell, old, new in regressions:
+                print(f"{name:<14} {metric:<10} {cell:<22} {old:>10.3f}us -> {new:>10.3f}us ({new / old:.2f}x)")
+            return 1
+        print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,13 @@
-import matplotlib.pyplot as plt
 import numpy as np
 
 from shared.match import MatchConfig
+from tournament_cache import MatchCache
 from tournament_core import make_strategies, print_leaderboard, run_tournament
 
 
 def grouped_bar_plot(results, strategy_names, bar_keys, title, y_getter, ylabel):
+    import matplotlib.pyplot as plt  # deferred: slow, and only needed to draw
+
     x = np.arange(len(strategy_names))
     width = 0.8 / max(1, len(bar_keys))
 
@@ -25,6 +27,8 @@ def grouped_bar_plot(results, strategy_names, bar_keys, title, y_getter, ylabel)
 def main():
     sweep_mode = "N"           # "N" or "rounds"
     play_both_orders = False
+    seed = 1234                # fixed seed: lets results be reused across runs
+    cache = MatchCache()       # on-disk results in .match_cache/
 
     results = {}
 
@@ -35,7 +39,8 @@ def main():
         for N in Ns:
             print(f"\n=== Running: N={N}, rounds={fixed_rounds} ===")
             cfg = MatchConfig(N=N, rounds=fixed_rounds, verbose=False)
-            stats, _ = run_tournament(make_strategies(), cfg, play_both_orders=play_both_orders)
+            stats, _ = run_tournament(make_strategies(), cfg, play_both_orders=play_both_orders,
+                                      seed=seed, cache=cache)
             results[N] = stats
             print_leaderboard(stats)
 
@@ -62,7 +67,8 @@ def main():
         for r in rounds_list:
             print(f"\n=== Running: N={fixed_N}, rounds={r} ===")
             cfg = MatchConfig(N=fixed_N, rounds=r, verbose=False)
-            stats, _ = run_tournament(make_strategies(), cfg, play_both_orders=play_both_orders)
+            stats, _ = run_tournament(make_strategies(), cfg, play_both_orders=play_both_orders,
+                                      seed=seed, cache=cache)
             results[r] = stats
             print_leaderboard(stats)
 
@@ -82,6 +88,8 @@ def main():
                          y_getter=lambda st, _k: st.points_for,
                          ylabel="Total payoff")
 
+    import matplotlib.pyplot as plt
+
     plt.show()
     return results
 
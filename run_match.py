@@ -1,11 +1,14 @@
+import sys
+
 from shared.match import MatchConfig
 from tournament_core import make_strategies, print_leaderboard, run_tournament
 
 
-def main():
+def main(patterns=()):
+    # Strategy names or patterns to play, e.g. `python run_match.py G2 "G[5-8]"`
     cfg = MatchConfig(N=100, rounds=1000, verbose=False)
-    stats, h2h = run_tournament(make_strategies(), cfg, play_both_orders=False)
+    stats, h2h = run_tournament(make_strategies(*patterns), cfg, play_both_orders=False)
     print_leaderboard(stats)
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
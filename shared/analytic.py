@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from .strategy_base import Strategy
+
+
+@dataclass(frozen=True)
+class PayoffMoments:
+    """
+    Exact per-round payoff moments when A bids from p and B from q,
+    independently. The two payoffs are never both positive, so
+    cov = -mean_a * mean_b.
+    """
+    mean_a: float
+    mean_b: float
+    var_a: float
+    var_b: float
+
+    @property
+    def cov(self) -> float:
+        return -self.mean_a * self.mean_b
+
+    def over(self, rounds: int) -> "PayoffMoments":
+        """
+        Moments of the match totals (rounds are independent).
+        """
+        return PayoffMoments(rounds * self.mean_a, rounds * self.mean_b,
+                             rounds * self.var_a, rounds * self.var_b)
+
+
+def normalize(weights: Sequence[float]) -> List[float]:
+    total = float(sum(weights))
+    if not total > 0:
+        raise ValueError("distribution needs at least one positive weight")
+    return [w / total for w in weights]
+
+
+def expected_payoff(p: Sequence[float], q: Sequence[float]) -> PayoffMoments:
+    """
+    Moments of shared.game.payoff for bids i ~ p, j ~ q over 1..N
+    (weights need not be normalized), in O(N):
+
+        E[payoff_A] = sum_i p_i * i * P(j > i)
+        E[payoff_A^2] = sum_i p_i * i^2 * P(j > i)
+
+    and symmetrically for B. Tail probabilities are suffix sums, so no
+    cancellation from 1 - CDF.
+    """
+    if len(p) != len(q):
+        raise ValueError(f"distributions over different N ({len(p)} vs {len(q)})")
+    p = normalize(p)
+    q = normalize(q)
+    m1_a = m2_a = m1_b = m2_b = 0.0
+    tail_p = tail_q = 0.0  # P(bid > i)
+    for i in range(len(p), 0, -1):
+        pi, qi = p[i - 1], q[i - 1]
+        m1_a += pi * i * tail_q
+        m2_a += pi * i * i * tail_q
+        m1_b += qi * i * tail_p
+        m2_b += qi * i * i * tail_p
+        tail_p += pi
+        tail_q += qi
+    return PayoffMoments(m1_a, m1_b, max(0.0, m2_a - m1_a * m1_a), max(0.0, m2_b - m1_b * m1_b))
+
+
+def expected_matrix(dists: Sequence[Sequence[float]]) -> List[List[float]]:
+    """
+    M[i][j] = expected per-round payoff of distribution i against j,
+    for all pairs (including i against itself), O(S^2 N).
+    """
+    S = len(dists)
+    M = [[0.0] * S for _ in range(S)]
+    for i in range(S):
+        for j in range(i, S):
+            m = expected_payoff(dists[i], dists[j])
+            M[i][j] = m.mean_a
+            M[j][i] = m.mean_b
+    return M
+
+
+def bid_distribution(strategy: Strategy) -> Optional[Sequence[float]]:
+    """
+    The distribution a strategy bids from in its current state, if it
+    exposes one (Strategy.bid_distribution), else None.
+    """
+    fn = getattr(strategy, "bid_distribution", None)
+    return fn() if fn is not None else None
+
+
+def stationary_distribution(strategy: Strategy) -> Optional[Sequence[float]]:
+    """
+    The distribution of a strategy that bids from it every round whatever
+    happens (declares stationary = True), else None.
+    """
+    if not getattr(strategy, "stationary", False):
+        return None
+    return bid_distribution(strategy)
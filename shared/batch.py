@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Protocol, Tuple, Union
+
+import numpy as np
+
+from .history import make_history
+from .match import MatchConfig
+from .rng import bind_rng, derive_seed, seat_rng
+from .strategy_base import Strategy, history_window
+from .types import MatchResult, Observation, ReusableMatchResult, ReusableObservation
+
+
+def payoff_batch(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    shared.game.payoff applied elementwise to arrays of bids:
+    the lower bid wins its own value, ties pay nothing.
+    """
+    return np.where(a < b, a, 0), np.where(b < a, b, 0)
+
+
+def validate_batch(a: np.ndarray, N: int) -> None:
+    """
+    Vectorized validate_action for a whole batch of bids.
+    """
+    if not np.issubdtype(a.dtype, np.integer):
+        raise TypeError(f"Actions must be integers, got dtype {a.dtype}")
+    if a.size and (a.min() < 1 or a.max() > N):
+        bad = a[(a < 1) | (a > N)][0]
+        raise ValueError(f"Action {bad} out of bounds (1..{N})")
+
+
+class BatchStrategy(Protocol):
+    """
+    Optional interface for strategies that can play B independent copies
+    of a match at once. Arrays have shape (B,); copy k only ever sees the
+    k-th entries.
+
+    Scalar strategies do not need this: BatchedMatch wraps them in
+    ScalarBatchAdapter.
+    """
+
+    name: str
+
+    def reset_batch(self, *, N: int, B: int) -> None:
+        """
+        Called ONCE before the batch starts (like reset, for all copies).
+        """
+        ...
+
+    def act_batch(self, t: int) -> np.ndarray:
+        """
+        Bids of every copy for round t, integers in {1, ..., N}.
+        """
+        ...
+
+    def on_result_batch(self, t: int, self_actions: np.ndarray, opp_actions: np.ndarray,
+                        self_payoffs: np.ndarray, opp_payoffs: np.ndarray) -> None:
+        """
+        Called AFTER each round with every copy's actions and payoffs.
+        """
+        ...
+
+
+class ScalarBatchAdapter:
+    """
+    Runs B independent instances of a scalar strategy behind the
+    BatchStrategy interface.
+
+    Each copy gets its own history (as much as its history_window asks
+    for). With fast=True the per-copy obs/result objects are reused, with
+    the same contract as MatchConfig.fast. With a seed, copy k draws from
+    the generator IteratedMatch would give it in `seat` of a match seeded
+    with derive_seed(seed, k).
+    """
+
+    def __init__(self, factory: Callable[[], Strategy], fast: bool = False,
+                 seed: Optional[int] = None, seat: str = "A") -> None:
+        self.factory = factory
+        self.fast = fast
+        self.seed = seed
+        self.seat = seat
+        self.copies: List[Strategy] = []
+        self.opponent_name = ""
+        probe = factory()
+        self.name = probe.name
+        self.window = history_window(probe)
+
+    def reset_batch(self, *, N: int, B: int) -> None:
+        self.N = N
+        self.copies = [self.factory() for _ in range(B)]
+        self._self_hist = [make_history(self.window) for _ in range(B)]
+        self._opp_hist = [make_history(self.window) for _ in range(B)]
+        for k, s in enumerate(self.copies):
+            if self.seed is not None:
+                bind_rng(s, seat_rng(derive_seed(self.seed, k), self.seat, s.name))
+            s.reset(N=N)
+        if self.fast:
+            self._obs = [ReusableObservation(N, 0, s.name, "", (), ()) for s in self.copies]
+            self._res = [ReusableMatchResult(N, 0, s.name, "", 0, 0, 0, 0) for s in self.copies]
+
+    def set_opponent_name(self, name: str) -> None:
+        self.opponent_name = name
+        if self.fast:
+            for o in self._obs:
+                o.opponent_name = name
+            for r in self._res:
+                r.opponent_name = name
+
+    def act_batch(self, t: int) -> np.ndarray:
+        w = self.window
+        bids = []
+        for k, s in enumerate(self.copies):
+            if self.fast:
+                obs = self._obs[k]
+                obs.t = t
+                obs.opp_action_history = self._opp_hist[k].view(w)
+                obs.self_action_history = self._self_hist[k].view(w)
+            else:
+                obs = Observation(
+                    N=self.N, t=t,
+                    self_name=s.name, opponent_name=self.opponent_name,
+                    opp_action_history=self._opp_hist[k].view(w),
+                    self_action_history=self._self_hist[k].view(w),
+                )
+            bids.append(s.act(obs))
+        for a in bids:
+            if not isinstance(a, int):
+                raise TypeError(f"Action must be int, got {type(a)}")
+        return np.array(bids, dtype=np.int64)
+
+    def on_result_batch(self, t: int, self_actions: np.ndarray, opp_actions: np.ndarray,
+                        self_payoffs: np.ndarray, opp_payoffs: np.ndarray) -> None:
+        mine = self_actions.tolist()
+        theirs = opp_actions.tolist()
+        my_pay = self_payoffs.tolist()
+        their_pay = opp_payoffs.tolist()
+        for k, s in enumerate(self.copies):
+            self._self_hist[k].append(mine[k])
+            self._opp_hist[k].append(theirs[k])
+            if self.fast:
+                res = self._res[k]
+                res.t = t
+                res.self_action = mine[k]
+                res.opp_action = theirs[k]
+                res.self_payoff = my_pay[k]
+                res.opp_payoff = their_pay[k]
+            else:
+                res = MatchResult(
+                    N=self.N, t=t,
+                    self_name=s.name, opponent_name=self.opponent_name,
+                    self_action=mine[k], opp_action=theirs[k],
+                    self_payoff=my_pay[k], opp_payoff=their_pay[k],
+                )
+            s.on_result(res)
+
+
+def as_batch(strategy: Union[BatchStrategy, Callable[[], Strategy]], fast: bool = False,
+             seed: Optional[int] = None, seat: str = "A"):
+    """
+    Use a strategy's own act_batch if it has one, otherwise wrap a
+    factory (usually the strategy class) in a ScalarBatchAdapter.
+    With a seed, the strategy (or each wrapped copy) draws from a private
+    generator for `seat`, as in a seeded IteratedMatch.
+    """
+    if not hasattr(strategy, "act_batch"):
+        return ScalarBatchAdapter(strategy, fast=fast, seed=seed, seat=seat)
+    if isinstance(strategy, type):
+        strategy = strategy()
+    if seed is not None:
+        bind_rng(strategy, seat_rng(seed, seat, strategy.name))
+    return strategy
+
+
+class BatchedMatch:
+    """
+    Plays B independent copies of one pairing in lockstep.
+
+    Each round both sides produce a (B,)-array of bids and the payoff is
+    computed for all copies with one vectorized operation, so the
+    per-round Python overhead is paid once per batch instead of once per
+    match. Strategies with act_batch are used directly; anything else is
+    given as a factory (e.g. the class) and wrapped in ScalarBatchAdapter.
+
+    With a seed, every strategy that draws from self.rng gets a private
+    generator (see as_batch), so the batch is reproducible.
+    """
+
+    def __init__(self, A, B, cfg: MatchConfig, batch: int, seed: Optional[int] = None):
+        self.A = as_batch(A, fast=cfg.fast, seed=seed, seat="A")
+        self.B = as_batch(B, fast=cfg.fast, seed=seed, seat="B")
+        self.cfg = cfg
+        self.batch = batch
+        self.seed = seed
+
+        # Cumulative scores of every copy
+        self.scoreA = np.zeros(batch, dtype=np.int64)
+        self.scoreB = np.zeros(batch, dtype=np.int64)
+
+    def run(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Play all copies for cfg.rounds and return their final scores as
+        two (B,)-arrays.
+        """
+        N = self.cfg.N
+        A, B = self.A, self.B
+        A.reset_batch(N=N, B=self.batch)
+        B.reset_batch(N=N, B=self.batch)
+        if isinstance(A, ScalarBatchAdapter):
+            A.set_opponent_name(B.name)
+        if isinstance(B, ScalarBatchAdapter):
+            B.set_opponent_name(A.name)
+
+        scoreA, scoreB = self.scoreA, self.scoreB
+        for t in range(1, self.cfg.rounds + 1):
+            a = A.act_batch(t)
+            b = B.act_batch(t)
+            validate_batch(a, N)
+            validate_batch(b, N)
+
+            pa, pb = payoff_batch(a, b)
+            scoreA += pa
+            scoreB += pb
+
+            A.on_result_batch(t, a, b, pa, pb)
+            B.on_result_batch(t, b, a, pb, pa)
+
+        return scoreA, scoreB
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from typing import Any, Dict
+
+# A checkpoint is one pickled dict {"magic", "version", "kind", ...}.
+# It is written to a temporary file in the same directory, fsynced, and
+# renamed over the old one, so a crash mid-write leaves the previous
+# checkpoint intact and a reader never sees a partial file.
+MAGIC = "CASCKPT"
+VERSION = 1
+
+
+def save_checkpoint(path: str, kind: str, state: Dict[str, Any]) -> None:
+    """
+    Atomically replace the checkpoint at `path` with `state`.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    payload = {"magic": MAGIC, "version": VERSION, "kind": kind, **state}
+    fd, tmp = tempfile.mkstemp(prefix=".ckpt-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_checkpoint(path: str, kind: str) -> Dict[str, Any]:
+    """
+    State saved by save_checkpoint(path, kind, ...).
+
+    Checkpoints are pickles: only load files you wrote yourself.
+    """
+    with open(path, "rb") as f:
+        payload = pickle.load(f)
+    if not isinstance(payload, dict) or payload.get("magic") != MAGIC:
+        raise ValueError(f"{path!r} is not a checkpoint")
+    if payload["version"] != VERSION:
+        raise ValueError(f"{path!r}: unsupported checkpoint version {payload['version']}")
+    if payload["kind"] != kind:
+        raise ValueError(f"{path!r} is a {payload['kind']} checkpoint, expected {kind}")
+    return payload
+
+
+def remove_checkpoint(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterator, Optional, Sequence, Tuple, Union, overload
+
+# Shared empty history handed out when a strategy declares history_window = 0
+EMPTY_HISTORY: Tuple[int, ...] = ()
+
+
+class ActionHistory:
+    """
+    Append-only record of one player's bids.
+
+    Bids are stored in a single compact typed buffer (array of C ints),
+    not a list of boxed Python ints. Observations get read-only views
+    over this buffer via view(), so handing out the history costs O(1)
+    per round instead of copying it.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = array("i")
+
+    def append(self, a: int) -> None:
+        self._buf.append(a)
+
+    def view(self, window: Optional[int] = None) -> Sequence[int]:
+        """
+        Snapshot view of the bids recorded so far (or of the last
+        `window` of them).
+
+        Later appends do not show up in an existing view.
+        """
+        n = len(self._buf)
+        if window is None:
+            return HistoryView(self._buf, 0, n)
+        if window == 0:
+            return EMPTY_HISTORY
+        return HistoryView(self._buf, max(0, n - window), n)
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+
+class WindowedHistory:
+    """
+    Keeps only the last `maxlen` bids of one player.
+
+    Used when no strategy in the match needs more than a bounded window,
+    so memory stays constant however many rounds are played.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self, maxlen: int) -> None:
+        self._buf: Deque[int] = deque(maxlen=maxlen)
+
+    def append(self, a: int) -> None:
+        self._buf.append(a)
+
+    def view(self, window: Optional[int] = None) -> Sequence[int]:
+        """
+        Tuple of the last `window` bids (O(window)).
+        """
+        if window == 0:
+            return EMPTY_HISTORY
+        n = len(self._buf)
+        if window is None or window >= n:
+            return tuple(self._buf)
+        return tuple(islice(self._buf, n - window, None))
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+
+class NullHistory:
+    """
+    Records nothing. Used when no strategy in the match reads history.
+    """
+
+    __slots__ = ()
+
+    def append(self, a: int) -> None:
+        pass
+
+    def view(self, window: Optional[int] = None) -> Sequence[int]:
+        return EMPTY_HISTORY
+
+    def __len__(self) -> int:
+        return 0
+
+
+def combine_windows(*windows: Optional[int]) -> Optional[int]:
+    """
+    History each player's buffer must keep so that every strategy in the
+    match gets the window it asked for (None means unbounded).
+    """
+    if any(w is None for w in windows):
+        return None
+    return max(windows, default=0)
+
+
+def make_history(window: Optional[int]):
+    """
+    Cheapest history buffer that can serve views of up to `window` bids.
+    """
+    if window is None:
+        return ActionHistory()
+    if window == 0:
+        return NullHistory()
+    return WindowedHistory(window)
+
+
+class HistoryView(Sequence[int]):
+    """
+    Read-only, fixed-length view over entries [start, stop) of an
+    ActionHistory buffer.
+
+    Supports indexing, slicing (returns a tuple), len and iteration,
+    and compares equal to a tuple with the same contents.
+    """
+
+    __slots__ = ("_buf", "_start", "_len")
+
+    def __init__(self, buf: array, start: int, stop: int) -> None:
+        self._buf = buf
+        self._start = start
+        self._len = stop - start
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, i: int) -> int: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> Tuple[int, ...]: ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[int, Tuple[int, ...]]:
+        if isinstance(i, slice):
+            r = range(*i.indices(self._len))
+            if not r:
+                return ()
+            first, last = self._start + r[0], self._start + r[-1]
+            if r.step > 0:
+                return tuple(self._buf[first:last + 1:r.step])
+            return tuple(self._buf[first:(last - 1 if last > 0 else None):r.step])
+        if i < 0:
+            i += self._len
+        if i < 0 or i >= self._len:
+            raise IndexError("history index out of range")
+        return self._buf[self._start + i]
+
+    def __iter__(self) -> Iterator[int]:
+        return map(self._buf.__getitem__, range(self._start, self._start + self._len))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HistoryView):
+            return self._len == other._len and tuple(self) == tuple(other)
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self)!r})"
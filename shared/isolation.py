@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import atexit
+import pickle
+import random
+import struct
+import threading
+import time
+import traceback
+from typing import List, Optional
+
+from .game import payoff
+from .history import make_history
+from .strategy_base import Strategy, history_window
+from .types import MatchResult, Observation
+
+# Fixed-width messages over the pipe: op + 4 ints (act/result), reply: status + bid
+_REQ = struct.Struct("<Bqqqq")
+_REP = struct.Struct("<Bq")
+
+_OP_RESET = 0
+_OP_ACT = 1
+_OP_RESULT = 2
+
+_OK = 0
+_ERROR = 1
+
+TIMEOUT_POLICIES = ("default", "forfeit")
+
+
+class StrategyForfeit(Exception):
+    """
+    Raised inside IteratedMatch when an isolated strategy exceeds its
+    time budget under timeout_policy="forfeit".
+    """
+
+    def __init__(self, name: str, reason: str) -> None:
+        super().__init__(f"{name} forfeits: {reason}")
+        self.name = name
+        self.reason = reason
+
+
+class StrategyError(RuntimeError):
+    """
+    An isolated strategy raised; carries the worker-side traceback.
+    """
+
+
+def _worker_main(conn) -> None:
+    """
+    Worker process loop: hosts one strategy instance at a time and
+    answers reset/act/result requests until the pipe closes.
+    """
+    strategy = None
+    mine = theirs = None
+    window: Optional[int] = None
+    N = 0
+    self_name = opp_name = ""
+    error: Optional[str] = None
+
+    while True:
+        try:
+            msg = conn.recv_bytes()
+        except EOFError:
+            return
+        op = msg[0]
+
+        if op == _OP_ACT:
+            _, t, _, _, _ = _REQ.unpack(msg)
+            if error is None:
+                try:
+                    obs = Observation(
+                        N=N, t=t,
+                        self_name=self_name, opponent_name=opp_name,
+                        opp_action_history=theirs.view(window),
+                        self_action_history=mine.view(window),
+                    )
+                    conn.send_bytes(_REP.pack(_OK, strategy.act(obs)))
+                    continue
+                except Exception:
+                    error = traceback.format_exc()
+            conn.send_bytes(_REP.pack(_ERROR, 0) + error.encode())
+
+        elif op == _OP_RESULT:
+            _, t, a, b, _ = _REQ.unpack(msg)
+            mine.append(a)
+            theirs.append(b)
+            if error is None:
+                pa, pb = payoff(a, b)
+                try:
+                    strategy.on_result(MatchResult(
+                        N=N, t=t,
+                        self_name=self_name, opponent_name=opp_name,
+                        self_action=a, opp_action=b,
+                        self_payoff=pa, opp_payoff=pb,
+                    ))
+                except Exception:
+                    error = traceback.format_exc()
+
+        else:  # _OP_RESET: pickled (strategy, N, opponent name, seed)
+            error = None
+            try:
+                strategy, N, opp_name, seed = pickle.loads(msg[1:])
+                random.seed(seed)
+                self_name = strategy.name
+                window = history_window(strategy)
+                mine, theirs = make_history(window), make_history(window)
+                strategy.reset(N=N)
+                conn.send_bytes(_REP.pack(_OK, 0))
+            except Exception:
+                error = traceback.format_exc()
+                conn.send_bytes(_REP.pack(_ERROR, 0) + error.encode())
+
+
+class StrategyWorker:
+    """
+    A persistent worker process plus its pipe. Reused across rounds and
+    matches (see acquire_worker/release_worker) to avoid spawn cost.
+    """
+
+    def __init__(self) -> None:
+        import multiprocessing  # deferred: only isolated matches start workers
+
+        parent, child = multiprocessing.Pipe(duplex=True)
+        self.conn = parent
+        self.process = multiprocessing.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def close(self) -> None:
+        self.conn.close()
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.kill()
+
+
+_IDLE: List[StrategyWorker] = []
+_POOL_LOCK = threading.Lock()
+
+
+def acquire_worker() -> StrategyWorker:
+    with _POOL_LOCK:
+        while _IDLE:
+            w = _IDLE.pop()
+            if w.process.is_alive():
+                return w
+    return StrategyWorker()
+
+
+def release_worker(w: StrategyWorker) -> None:
+    with _POOL_LOCK:
+        _IDLE.append(w)
+
+
+@atexit.register
+def shutdown_workers() -> None:
+    """
+    Stop all idle workers (called automatically at exit).
+    """
+    with _POOL_LOCK:
+        idle, _IDLE[:] = list(_IDLE), []
+    for w in idle:
+        w.close()
+
+
+class IsolatedStrategy:
+    """
+    Proxy that runs a strategy in a worker process and enforces time
+    budgets on it.
+
+    Only round numbers and bids cross the pipe (fixed-width structs); the
+    worker rebuilds Observations and histories itself. A move that takes
+    longer than the per-move budget, or that would exceed the per-match
+    budget, kills the worker and then either:
+    - "default": this and every later move of the match is bid N
+      (never wins), or
+    - "forfeit": StrategyForfeit is raised, ending the match.
+
+    seed seeds the worker's global `random` at every reset (None: fresh
+    entropy), for strategies that draw from it instead of self.rng.
+    """
+
+    # The engine does not need to keep history for the proxy
+    history_window = 0
+
+    def __init__(self, inner: Strategy, opponent_name: str,
+                 move_budget: Optional[float] = None,
+                 match_budget: Optional[float] = None,
+                 policy: str = "default",
+                 seed: Optional[int] = None) -> None:
+        if policy not in TIMEOUT_POLICIES:
+            raise ValueError(f"Unknown timeout policy {policy!r} (expected one of {TIMEOUT_POLICIES})")
+        self.inner = inner
+        self.name = inner.name
+        self.opponent_name = opponent_name
+        self.move_budget = move_budget
+        self.match_budget = match_budget
+        self.policy = policy
+        self.seed = seed
+        self.worker: Optional[StrategyWorker] = None
+        self.N = 0
+        self.used = 0.0       # seconds charged against the match budget
+        self.timeouts = 0     # moves replaced by the default bid
+        self.dead = False
+
+    def _budget(self) -> Optional[float]:
+        budget = self.move_budget
+        if self.match_budget is not None:
+            left = max(0.0, self.match_budget - self.used)
+            budget = left if budget is None else min(budget, left)
+        return budget
+
+    def _call(self, request: bytes, budget: Optional[float], what: str) -> int:
+        conn = self.worker.conn
+        t0 = time.perf_counter()
+        conn.send_bytes(request)
+        if budget is not None and not conn.poll(budget):
+            self.used += time.perf_counter() - t0
+            self._timed_out(f"{what} exceeded {budget:.3f}s")
+            return self.N
+        reply = conn.recv_bytes()
+        self.used += time.perf_counter() - t0
+        status, value = _REP.unpack_from(reply)
+        if status != _OK:
+            raise StrategyError(f"{self.name} failed in worker:\n{reply[_REP.size:].decode()}")
+        return value
+
+    def _timed_out(self, reason: str) -> None:
+        self.worker.kill()
+        self.worker = None
+        self.dead = True
+        self.timeouts += 1
+        if self.policy == "forfeit":
+            raise StrategyForfeit(self.name, reason)
+
+    def reset(self, *, N: int) -> None:
+        self.N = N
+        self.used = 0.0
+        self.timeouts = 0
+        self.dead = False
+        if self.worker is None:
+            self.worker = acquire_worker()
+        payload = pickle.dumps((self.inner, N, self.opponent_name, self.seed))
+        self._call(bytes([_OP_RESET]) + payload, self.match_budget, "reset")
+
+    def act(self, obs: Observation) -> int:
+        if self.dead:
+            self.timeouts += 1
+            return self.N
+        return self._call(_REQ.pack(_OP_ACT, obs.t, 0, 0, 0), self._budget(), f"move {obs.t}")
+
+    def on_result(self, result: MatchResult) -> None:
+        # Fire and forget: its cost is charged to the next act's round trip
+        if not self.dead:
+            self.worker.conn.send_bytes(
+                _REQ.pack(_OP_RESULT, result.t, result.self_action, result.opp_action, 0))
+
+    def close(self) -> None:
+        """
+        Return the worker to the pool for the next match.
+        """
+        if self.worker is not None:
+            release_worker(self.worker)
+            self.worker = None
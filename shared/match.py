@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import random
+import tracemalloc
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Optional, Sequence, Tuple
 
+from .checkpoint import load_checkpoint, remove_checkpoint, save_checkpoint
 from .game import payoff, validate_action
-from .strategy_base import Strategy
-from .types import MatchResult, Observation
+from .history import EMPTY_HISTORY, NullHistory, combine_windows, make_history
+from .isolation import IsolatedStrategy, StrategyForfeit
+from .observers import ConsoleObserver, MatchObserver, hooks, round_hook
+from .profiling import ProfiledStrategy, StrategyProfile, profile_of
+from .rng import bind_rng, derive_seed, seat_rng
+from .strategy_base import Strategy, history_window
+from .trace import TraceWriter
+from .types import MatchResult, Observation, ReusableMatchResult, ReusableObservation
 
 
 @dataclass
@@ -15,36 +24,145 @@ class MatchConfig:
     """
     N: int           # number of possible bids
     rounds: int      # how many times the game is repeated
-    verbose: bool    # print each round if True
+    verbose: bool    # print each round if True (attaches a ConsoleObserver)
+
+    # Fast path: reuse slotted message objects instead of allocating
+    # Observation/MatchResult every round, and validate bids only while
+    # certifying each strategy (first certify_rounds rounds) and then
+    # every validate_every-th round (0 = never again).
+    # Strategies must not keep references to obs/result objects.
+    fast: bool = False
+    certify_rounds: int = 32
+    validate_every: int = 0
+
+    # Record time spent inside each strategy's reset/act/on_result
+    # (IteratedMatch.profileA/profileB); profile_memory also tracks peak
+    # tracemalloc memory (slow). Off = no overhead at all.
+    profile: bool = False
+    profile_memory: bool = False
+
+    # Run each strategy in a persistent worker process (reused across
+    # matches) and enforce time budgets in seconds. A strategy over budget
+    # either bids N for the rest of the match (timeout_policy="default")
+    # or forfeits it ("forfeit"; IteratedMatch.forfeited names the seat).
+    isolate: bool = False
+    move_time_budget: Optional[float] = None
+    match_time_budget: Optional[float] = None
+    timeout_policy: str = "default"
+
+    # Stream every round (t, bidA, bidB, payA, payB) into a binary trace
+    # file at this path (see shared.trace for the format and the reader).
+    trace_path: Optional[str] = None
+
+    # Tournaments only: when both strategies are stationary (same bid
+    # distribution every round, see shared.analytic), score the match with
+    # its exact expected payoffs instead of playing it. Scores are floats.
+    analytic: bool = False
+
+    # Every checkpoint_every rounds, atomically save the whole match state
+    # (round, scores, histories, pickled strategies and RNG state) to
+    # checkpoint_path; IteratedMatch.resume(path) continues from there.
+    # The file is removed once the match finishes. Not with isolate.
+    checkpoint_path: Optional[str] = None
+    checkpoint_every: int = 0
 
 
 class IteratedMatch:
     """
     Runs a repeated 1v1 bidding game between two strategies.
+
+    observers receive match start/end and round events (see
+    shared.observers); with none attached the loop makes no calls.
+
+    With a seed, each strategy that draws from self.rng gets its own
+    generator derived from (seed, seat, name), so its draws do not depend
+    on the opponent or on scheduling (see shared.rng.seat_rng).
     """
 
-    def __init__(self, A: Strategy, B: Strategy, cfg: MatchConfig):
+    def __init__(self, A: Strategy, B: Strategy, cfg: MatchConfig,
+                 observers: Sequence[MatchObserver] = (), seed: Optional[int] = None):
+        if cfg.isolate and cfg.checkpoint_path is not None:
+            raise ValueError("isolated matches cannot be checkpointed (strategy state lives in worker processes)")
+        self.seed = seed
+        if seed is not None:
+            bind_rng(A, seat_rng(seed, "A", A.name))
+            bind_rng(B, seat_rng(seed, "B", B.name))
+        self.isolated: Tuple[IsolatedStrategy, ...] = ()
+        if cfg.isolate:
+            budgets = (cfg.move_time_budget, cfg.match_time_budget, cfg.timeout_policy)
+            # Worker seeds come from the match seed, never from the caller's random
+            seeds = (None, None) if seed is None else (derive_seed(seed, "A", A.name, "worker"),
+                                                       derive_seed(seed, "B", B.name, "worker"))
+            A = IsolatedStrategy(A, B.name, *budgets, seed=seeds[0])
+            B = IsolatedStrategy(B, A.name, *budgets, seed=seeds[1])
+            self.isolated = (A, B)
+        if cfg.profile or cfg.profile_memory:
+            A = ProfiledStrategy(A, memory=cfg.profile_memory)
+            B = ProfiledStrategy(B, memory=cfg.profile_memory)
         self.A = A
         self.B = B
         self.cfg = cfg
+        self.observers = list(observers)
+        if cfg.verbose:
+            self.observers.append(ConsoleObserver())
+
+        # How much history each side asked for
+        self.A_window = history_window(A)
+        self.B_window = history_window(B)
 
-        # Store full action history
-        self.A_actions: List[int] = []
-        self.B_actions: List[int] = []
+        # Store action history, only as much as the strategies need
+        keep = combine_windows(self.A_window, self.B_window)
+        self.A_actions = make_history(keep)
+        self.B_actions = make_history(keep)
 
-        # Cumulative scores
+        # Cumulative scores, and rounds played so far
         self.scoreA = 0
         self.scoreB = 0
+        self.t = 0
 
-    def _print_round(self, t: int, a: int, b: int, pa: int, pb: int) -> None:
+        # "A" or "B" if that side forfeited (isolate + timeout_policy="forfeit")
+        self.forfeited: Optional[str] = None
+
+    def save(self, path: str) -> None:
+        """
+        Checkpoint the match as it stands after round self.t. The global
+        `random` state is saved too, for strategies drawing from it.
         """
-        Helper to print one round's result.
+        state = {k: v for k, v in self.__dict__.items() if k != "observers"}
+        save_checkpoint(path, "match", {"match": state, "random": random.getstate()})
+
+    @classmethod
+    def resume(cls, path: str, observers: Sequence[MatchObserver] = ()) -> "IteratedMatch":
         """
-        print(
-            f"Round {t:3d} | "
-            f"{self.A.name}: bid={a:2d}, payoff={pa:2d}, total={self.scoreA:4d} || "
-            f"{self.B.name}: bid={b:2d}, payoff={pb:2d}, total={self.scoreB:4d}"
-        )
+        The match saved at `path`, ready to run() on from the round after
+        the checkpoint (restores the global `random` state as well). The
+        final scores, histories and trace equal an uninterrupted run's.
+        """
+        saved = load_checkpoint(path, "match")
+        match = cls.__new__(cls)
+        match.__dict__.update(saved["match"])
+        match.observers = list(observers)
+        if match.cfg.verbose:
+            match.observers.append(ConsoleObserver())
+        random.setstate(saved["random"])
+        return match
+
+    @property
+    def timeouts(self) -> Tuple[int, int]:
+        """
+        Moves of (A, B) replaced by the default bid after a timeout.
+        """
+        if not self.isolated:
+            return (0, 0)
+        return (self.isolated[0].timeouts, self.isolated[1].timeouts)
+
+    @property
+    def profileA(self) -> Optional[StrategyProfile]:
+        return profile_of(self.A)
+
+    @property
+    def profileB(self) -> Optional[StrategyProfile]:
+        return profile_of(self.B)
 
     def run(self) -> Tuple[int, int]:
         """
@@ -53,22 +171,76 @@ class IteratedMatch:
         - repeat bidding for cfg.rounds
         - return final scores
         """
-        self.A.reset(N=self.cfg.N)
-        self.B.reset(N=self.cfg.N)
+        for hook in hooks(self.observers, "match_start"):
+            hook(self.A.name, self.B.name, self.cfg.N, self.cfg.rounds)
+        if self.cfg.profile_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            try:
+                scores = self._run_guarded()
+            finally:
+                tracemalloc.stop()
+        else:
+            scores = self._run_guarded()
+        for hook in hooks(self.observers, "match_end"):
+            hook(self.A.name, self.B.name, *scores)
+        return scores
 
-        for t in range(1, self.cfg.rounds + 1):
-            # Build observations
+    def _run_guarded(self) -> Tuple[int, int]:
+        if not self.isolated:
+            return self._run()
+        try:
+            return self._run()
+        except StrategyForfeit:
+            self.forfeited = "A" if self.isolated[0].dead else "B"
+            return self.scoreA, self.scoreB
+        finally:
+            for proxy in self.isolated:
+                proxy.close()
+
+    def _run(self) -> Tuple[int, int]:
+        cfg = self.cfg
+        if self.t == 0:  # not resumed
+            self.A.reset(N=cfg.N)
+            self.B.reset(N=cfg.N)
+
+        trace = None
+        if cfg.trace_path is not None:
+            trace = TraceWriter(cfg.trace_path, cfg.N, self.A.name, self.B.name, start_round=self.t)
+        on_round = round_hook(self.observers)
+        play = self._run_fast if cfg.fast else self._run_standard
+        every = cfg.checkpoint_every if cfg.checkpoint_path is not None else 0
+        try:
+            # Play up to each checkpoint round in one uninterrupted loop
+            while self.t < cfg.rounds:
+                stop = cfg.rounds if not every else min(cfg.rounds, (self.t // every + 1) * every)
+                play(trace, on_round, stop)
+                if every and self.t < cfg.rounds:
+                    if trace is not None:
+                        trace.flush()
+                    self.save(cfg.checkpoint_path)
+        finally:
+            if trace is not None:
+                trace.close()
+        if every:
+            remove_checkpoint(cfg.checkpoint_path)
+        return self.scoreA, self.scoreB
+
+    def _run_standard(self, trace: Optional[TraceWriter], on_round,
+                      stop: Optional[int] = None) -> Tuple[int, int]:
+        stop = self.cfg.rounds if stop is None else stop
+        for t in range(self.t + 1, stop + 1):
+            # Build observations (views, no copying of full histories)
             obsA = Observation(
                 N=self.cfg.N, t=t,
                 self_name=self.A.name, opponent_name=self.B.name,
-                opp_action_history=tuple(self.B_actions),
-                self_action_history=tuple(self.A_actions),
+                opp_action_history=self.B_actions.view(self.A_window),
+                self_action_history=self.A_actions.view(self.A_window),
             )
             obsB = Observation(
                 N=self.cfg.N, t=t,
                 self_name=self.B.name, opponent_name=self.A.name,
-                opp_action_history=tuple(self.A_actions),
-                self_action_history=tuple(self.B_actions),
+                opp_action_history=self.A_actions.view(self.B_window),
+                self_action_history=self.B_actions.view(self.B_window),
             )
 
             # Strategies choose bids
@@ -86,8 +258,10 @@ class IteratedMatch:
             self.A_actions.append(a)
             self.B_actions.append(b)
 
-            if self.cfg.verbose:
-                self._print_round(t, a, b, pa, pb)
+            if on_round is not None:
+                on_round(t, a, b, pa, pb, self.scoreA, self.scoreB)
+            if trace is not None:
+                trace.record(t, a, b, pa, pb)
 
             # Notify strategies of result
             self.A.on_result(MatchResult(
@@ -103,4 +277,84 @@ class IteratedMatch:
                 self_payoff=pb, opp_payoff=pa,
             ))
 
-        return self.scoreA, self.scoreB
\ No newline at end of file
+        self.t = stop
+        return self.scoreA, self.scoreB
+
+    def _run_fast(self, trace: Optional[TraceWriter] = None, on_round=None,
+                  stop: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Same game as run(), with per-round overhead stripped:
+        one ReusableObservation/ReusableMatchResult per side updated in
+        place, attribute lookups hoisted, and sampled validation.
+        Scores are identical to the standard loop.
+        """
+        cfg = self.cfg
+        N = cfg.N
+        A, B = self.A, self.B
+        actA, actB = A.act, B.act
+        notifyA, notifyB = A.on_result, B.on_result
+        histA, histB = self.A_actions, self.B_actions
+        winA, winB = self.A_window, self.B_window
+        record = not isinstance(histA, NullHistory)
+        viewsA = winA != 0
+        viewsB = winB != 0
+
+        obsA = ReusableObservation(N, 0, A.name, B.name, EMPTY_HISTORY, EMPTY_HISTORY)
+        obsB = ReusableObservation(N, 0, B.name, A.name, EMPTY_HISTORY, EMPTY_HISTORY)
+        resA = ReusableMatchResult(N, 0, A.name, B.name, 0, 0, 0, 0)
+        resB = ReusableMatchResult(N, 0, B.name, A.name, 0, 0, 0, 0)
+
+        record_round = trace.record if trace is not None else None
+
+        certify = cfg.certify_rounds
+        every = cfg.validate_every
+        scoreA = self.scoreA
+        scoreB = self.scoreB
+        stop = cfg.rounds if stop is None else stop
+
+        for t in range(self.t + 1, stop + 1):
+            obsA.t = t
+            obsB.t = t
+            if viewsA:
+                obsA.opp_action_history = histB.view(winA)
+                obsA.self_action_history = histA.view(winA)
+            if viewsB:
+                obsB.opp_action_history = histA.view(winB)
+                obsB.self_action_history = histB.view(winB)
+
+            a = actA(obsA)
+            b = actB(obsB)
+            if t <= certify or (every and t % every == 0):
+                validate_action(a, N)
+                validate_action(b, N)
+
+            pa, pb = payoff(a, b)
+            scoreA += pa
+            scoreB += pb
+
+            if record:
+                histA.append(a)
+                histB.append(b)
+            if record_round is not None:
+                record_round(t, a, b, pa, pb)
+            if on_round is not None:
+                on_round(t, a, b, pa, pb, scoreA, scoreB)
+
+            resA.t = t
+            resA.self_action = a
+            resA.opp_action = b
+            resA.self_payoff = pa
+            resA.opp_payoff = pb
+            notifyA(resA)
+
+            resB.t = t
+            resB.self_action = b
+            resB.opp_action = a
+            resB.self_payoff = pb
+            resB.opp_payoff = pa
+            notifyB(resB)
+
+        self.scoreA = scoreA
+        self.scoreB = scoreB
+        self.t = stop
+        return scoreA, scoreB
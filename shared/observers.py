@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import sys
+from typing import Callable, FrozenSet, List, Optional, Sequence, TextIO
+
+EVENTS = ("match_start", "round", "match_end", "tournament_start",
+          "tournament_progress", "tournament_end")
+
+
+class MatchObserver:
+    """
+    Base class for match and tournament observers. Every hook is a no-op;
+    override only the ones you need. Hooks that are not overridden are
+    never called, so a match with no round observer pays nothing per round.
+
+    round_every: deliver only every k-th round (t % k == 0).
+    events: if set, only these event names (see EVENTS) are delivered.
+    """
+
+    round_every: int = 1
+    events: Optional[FrozenSet[str]] = None
+
+    def on_match_start(self, a_name: str, b_name: str, N: int, rounds: int) -> None:
+        pass
+
+    def on_round(self, t: int, a: int, b: int, pa: int, pb: int,
+                 score_a: int, score_b: int) -> None:
+        pass
+
+    def on_match_end(self, a_name: str, b_name: str, score_a: int, score_b: int) -> None:
+        pass
+
+    def on_tournament_start(self, matches: int) -> None:
+        pass
+
+    def on_tournament_progress(self, done: int, total: int) -> None:
+        pass
+
+    def on_tournament_end(self, stats) -> None:
+        pass
+
+    def close(self) -> None:
+        """
+        Flush anything still buffered.
+        """
+        pass
+
+
+def wants(observer: MatchObserver, event: str) -> bool:
+    """
+    Whether `observer` handles `event` (overrides its hook and does not
+    filter it out).
+    """
+    hook = "on_" + event
+    if getattr(type(observer), hook) is getattr(MatchObserver, hook):
+        return False
+    return observer.events is None or event in observer.events
+
+
+def hooks(observers: Sequence[MatchObserver], event: str) -> List[Callable]:
+    """
+    Bound hooks of the observers that handle `event`.
+    """
+    return [getattr(o, "on_" + event) for o in observers if wants(o, event)]
+
+
+def round_hook(observers: Sequence[MatchObserver]) -> Optional[Callable]:
+    """
+    One callable (t, a, b, pa, pb, score_a, score_b) delivering a round to
+    every observer that wants it, honouring round_every; None when nobody
+    does, so the round loop can skip the call entirely.
+    """
+    targets = [(o.round_every, o.on_round) for o in observers if wants(o, "round")]
+    if not targets:
+        return None
+    if len(targets) == 1:
+        every, fn = targets[0]
+        if every == 1:
+            return fn
+
+        def sampled(t, a, b, pa, pb, sa, sb):
+            if t % every == 0:
+                fn(t, a, b, pa, pb, sa, sb)
+        return sampled
+
+    def fanout(t, a, b, pa, pb, sa, sb):
+        for every, fn in targets:
+            if t % every == 0:
+                fn(t, a, b, pa, pb, sa, sb)
+    return fanout
+
+
+class _Buffered(MatchObserver):
+    # Lines are collected and written in blocks of buffer_lines, so a
+    # block from one match never interleaves with another's output.
+
+    def __init__(self, stream: TextIO, buffer_lines: int) -> None:
+        self.stream = stream
+        self.buffer_lines = buffer_lines
+        self._lines: List[str] = []
+
+    def _emit(self, line: str) -> None:
+        self._lines.append(line)
+        if len(self._lines) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self._lines = []
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ConsoleObserver(_Buffered):
+    """
+    Prints rounds in the `verbose` format, buffered.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, *, round_every: int = 1,
+                 events: Optional[FrozenSet[str]] = None, buffer_lines: int = 256) -> None:
+        super().__init__(stream if stream is not None else sys.stdout, buffer_lines)
+        self.round_every = round_every
+        self.events = events
+        self._names = ("A", "B")
+
+    def on_match_start(self, a_name: str, b_name: str, N: int, rounds: int) -> None:
+        self._names = (a_name, b_name)
+
+    def on_round(self, t, a, b, pa, pb, score_a, score_b) -> None:
+        self._emit(
+            f"Round {t:3d} | "
+            f"{self._names[0]}: bid={a:2d}, payoff={pa:2d}, total={score_a:4d} || "
+            f"{self._names[1]}: bid={b:2d}, payoff={pb:2d}, total={score_b:4d}"
+        )
+
+    def on_match_end(self, a_name, b_name, score_a, score_b) -> None:
+        self.flush()
+
+    def on_tournament_progress(self, done: int, total: int) -> None:
+        self._emit(f"[{done}/{total}] matches done")
+        self.flush()
+
+
+class FileObserver(ConsoleObserver):
+    """
+    ConsoleObserver writing to a file instead (closed by close()).
+    """
+
+    def __init__(self, path: str, *, round_every: int = 1,
+                 events: Optional[FrozenSet[str]] = None, buffer_lines: int = 4096) -> None:
+        super().__init__(open(path, "w"), round_every=round_every,
+                         events=events, buffer_lines=buffer_lines)
+        self.path = path
+
+    def close(self) -> None:
+        if not self.stream.closed:
+            self.flush()
+            self.stream.close()
+
+
+class SummaryObserver(_Buffered):
+    """
+    One line every k rounds: mean bid and payoff of each side over those
+    k rounds, plus the running totals.
+    """
+
+    def __init__(self, k: int = 1000, stream: Optional[TextIO] = None,
+                 buffer_lines: int = 1) -> None:
+        super().__init__(stream if stream is not None else sys.stdout, buffer_lines)
+        self.k = k
+        self._names = ("A", "B")
+        self._reset_window(1)
+
+    def _reset_window(self, first: int) -> None:
+        self._first = first
+        self._n = 0
+        self._bid_a = self._bid_b = self._pay_a = self._pay_b = 0
+
+    def on_match_start(self, a_name: str, b_name: str, N: int, rounds: int) -> None:
+        self._names = (a_name, b_name)
+        self._reset_window(1)
+
+    def on_round(self, t, a, b, pa, pb, score_a, score_b) -> None:
+        self._n += 1
+        self._bid_a += a
+        self._bid_b += b
+        self._pay_a += pa
+        self._pay_b += pb
+        if self._n == self.k:
+            self._summarize(t, score_a, score_b)
+
+    def _summarize(self, t: int, score_a: int, score_b: int) -> None:
+        n = self._n
+        self._emit(
+            f"Rounds {self._first}-{t} | "
+            f"{self._names[0]}: bid={self._bid_a / n:.2f}, payoff={self._pay_a / n:.2f}, total={score_a} || "
+            f"{self._names[1]}: bid={self._bid_b / n:.2f}, payoff={self._pay_b / n:.2f}, total={score_b}"
+        )
+        self._reset_window(t + 1)
+
+    def on_match_end(self, a_name, b_name, score_a, score_b) -> None:
+        if self._n:
+            self._summarize(self._first + self._n - 1, score_a, score_b)
+        self.flush()
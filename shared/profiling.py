@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+from .strategy_base import Strategy, history_window
+from .types import MatchResult, Observation
+
+
+@dataclass
+class StrategyProfile:
+    """
+    Time and memory one strategy spent inside its own methods.
+
+    Times are in seconds (wall = perf_counter, cpu = thread CPU time).
+    peak_mem is the highest number of bytes the strategy held at once
+    (memory it kept between calls plus transient use inside a call), as
+    traced by tracemalloc; 0 when memory tracking was off.
+    """
+    reset_wall: float = 0.0
+    reset_cpu: float = 0.0
+    act_wall: float = 0.0
+    act_cpu: float = 0.0
+    result_wall: float = 0.0
+    result_cpu: float = 0.0
+    act_calls: int = 0
+    result_calls: int = 0
+    peak_mem: int = 0
+
+    @property
+    def total_wall(self) -> float:
+        return self.reset_wall + self.act_wall + self.result_wall
+
+    @property
+    def total_cpu(self) -> float:
+        return self.reset_cpu + self.act_cpu + self.result_cpu
+
+    def merge(self, other: "StrategyProfile") -> None:
+        """
+        Add another match's profile into this one (peak is a max).
+        """
+        self.reset_wall += other.reset_wall
+        self.reset_cpu += other.reset_cpu
+        self.act_wall += other.act_wall
+        self.act_cpu += other.act_cpu
+        self.result_wall += other.result_wall
+        self.result_cpu += other.result_cpu
+        self.act_calls += other.act_calls
+        self.result_calls += other.result_calls
+        self.peak_mem = max(self.peak_mem, other.peak_mem)
+
+
+class ProfiledStrategy:
+    """
+    Wraps a strategy and records the time (and optionally memory) spent
+    in reset/act/on_result into a StrategyProfile.
+
+    IteratedMatch only wraps strategies when profiling is requested, so
+    unprofiled matches pay nothing for this.
+    """
+
+    def __init__(self, inner: Strategy, memory: bool = False) -> None:
+        self.inner = inner
+        self.name = inner.name
+        self.history_window = history_window(inner)
+        self.profile = StrategyProfile()
+        self.memory = memory
+        self._held = 0  # bytes allocated by the strategy and not yet freed
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes the wrapper itself lacks
+        if attr == "inner":
+            raise AttributeError(attr)
+        return getattr(self.inner, attr)
+
+    def _traced(self, fn, *args, **kwargs):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        out = fn(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        self.profile.peak_mem = max(self.profile.peak_mem, self._held + peak - before)
+        self._held += current - before
+        return out
+
+    def reset(self, *, N: int) -> None:
+        p = self.profile
+        w0, c0 = time.perf_counter(), time.thread_time()
+        if self.memory:
+            self._traced(self.inner.reset, N=N)
+        else:
+            self.inner.reset(N=N)
+        p.reset_cpu += time.thread_time() - c0
+        p.reset_wall += time.perf_counter() - w0
+
+    def act(self, obs: Observation) -> int:
+        p = self.profile
+        w0, c0 = time.perf_counter(), time.thread_time()
+        if self.memory:
+            a = self._traced(self.inner.act, obs)
+        else:
+            a = self.inner.act(obs)
+        p.act_cpu += time.thread_time() - c0
+        p.act_wall += time.perf_counter() - w0
+        p.act_calls += 1
+        return a
+
+    def on_result(self, result: MatchResult) -> None:
+        p = self.profile
+        w0, c0 = time.perf_counter(), time.thread_time()
+        if self.memory:
+            self._traced(self.inner.on_result, result)
+        else:
+            self.inner.on_result(result)
+        p.result_cpu += time.thread_time() - c0
+        p.result_wall += time.perf_counter() - w0
+        p.result_calls += 1
+
+
+def profile_of(strategy: object) -> Optional[StrategyProfile]:
+    """
+    The profile recorded for a (possibly wrapped) strategy, if any.
+    """
+    return strategy.profile if isinstance(strategy, ProfiledStrategy) else None
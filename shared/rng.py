@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from itertools import chain, islice
+from typing import Iterator, List, Optional
+
+
+def derive_seed(seed: int, *parts: object) -> int:
+    """
+    Derive an independent 64-bit seed from a base seed and labels
+    (e.g. strategy names and seat order).
+
+    The result depends only on its inputs, so a match gets the same seed
+    however the tournament schedules it.
+    """
+    key = repr((seed,) + parts).encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "little")
+
+
+class BlockRandom(random.Random):
+    """
+    A random.Random whose uniforms come from a NumPy PCG64 generator,
+    drawn `block` at a time. randint, choices, uniform, ... are built on
+    random(), so the whole stream is fixed by the seed alone.
+
+    random() is a C-level iterator step over the current block (no
+    Python frame per draw), and uniforms(k) hands out the next k uniforms
+    of the same stream in one call for strategies that consume
+    randomness in bulk. Picklable: the state includes the unread part of
+    the current block.
+    """
+
+    def __init__(self, seed: Optional[int] = None, block: int = 4096) -> None:
+        self.block = block
+        super().__init__(seed)
+
+    def seed(self, a: Optional[int] = None, version: int = 2) -> None:
+        import numpy as np
+
+        # Seed the base generator too: getrandbits (randbytes, ...) still uses it
+        super().seed(a, version)
+        self._gen = np.random.Generator(np.random.PCG64(a))
+        self._start([])
+
+    def _start(self, first: List[float]) -> None:
+        self._cur = iter(first)
+        self._stream = chain.from_iterable(self._blocks())
+        # Shadows the method below with the stream's own __next__
+        self.random = self._stream.__next__
+
+    def _blocks(self) -> Iterator[Iterator[float]]:
+        yield self._cur
+        while True:
+            self._cur = iter(self._gen.random(self.block).tolist())
+            yield self._cur
+
+    def random(self) -> float:
+        return next(self._stream)
+
+    def uniforms(self, k: int) -> List[float]:
+        """
+        The next k uniforms of the stream, as a list.
+        """
+        return list(islice(self._stream, k))
+
+    def getstate(self):
+        # Unread rest of the current block, from its iterator's position
+        red = self._cur.__reduce__()
+        rest = red[1][0][red[2]:] if len(red) == 3 else []
+        return (super().getstate(), self._gen.bit_generator.state, list(rest), self.block)
+
+    def setstate(self, state) -> None:
+        import numpy as np
+
+        base_state, gen_state, rest, self.block = state
+        super().setstate(base_state)
+        self._gen = np.random.Generator(np.random.PCG64())
+        self._gen.bit_generator.state = gen_state
+        self._start(list(rest))
+
+
+def seat_rng(seed: int, seat: str, name: str) -> BlockRandom:
+    """
+    Private generator for the strategy `name` playing in `seat` ("A" or
+    "B") of the match seeded with `seed`. It depends on nothing else, so
+    a strategy's draws do not depend on what its opponent consumed or on
+    how matches are scheduled.
+    """
+    return BlockRandom(derive_seed(seed, seat, name))
+
+
+def bind_rng(strategy: object, rng: random.Random) -> bool:
+    """
+    Hand `rng` to a strategy that draws from self.rng (declares an `rng`
+    attribute, see Strategy.rng). Returns whether it did.
+    """
+    if not hasattr(strategy, "rng"):
+        return False
+    strategy.rng = rng
+    return True
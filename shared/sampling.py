@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import random
+from typing import List, Sequence
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for a fixed discrete distribution over the
+    outcomes start, start+1, ..., start+n-1.
+
+    Built once in O(n); every draw is O(1) and uses a single uniform
+    (the integer part picks a column, the fractional part picks between
+    the column and its alias). Weights need not be normalized.
+    """
+
+    __slots__ = ("n", "start", "_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float], start: int = 1) -> None:
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or not total > 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        if any(w < 0 for w in weights):
+            raise ValueError("AliasTable weights must be non-negative")
+
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers are 1.0 up to rounding error
+        for i in small + large:
+            prob[i] = 1.0
+        # Sentinel column: random() * n can round up to exactly n
+        prob.append(0.0)
+        alias.append(n - 1)
+
+        self.n = n
+        self.start = start
+        self._prob = prob
+        self._alias = alias
+
+    def sample(self, rng=random) -> int:
+        """
+        One draw, O(1). `rng` is anything with a random() method
+        (default: the random module).
+        """
+        u = rng.random() * self.n
+        i = int(u)
+        if u - i >= self._prob[i]:
+            i = self._alias[i]
+        return self.start + i
+
+    def sample_many(self, k: int, rng=random) -> List[int]:
+        """
+        k independent draws.
+        """
+        n, prob, alias, start = self.n, self._prob, self._alias, self.start
+        r = rng.random
+        out = []
+        for _ in range(k):
+            u = r() * n
+            i = int(u)
+            out.append(start + (i if u - i < prob[i] else alias[i]))
+        return out
+
+    def sample_array(self, k: int, np_rng=None):
+        """
+        k independent draws as a NumPy int64 array, fully vectorized.
+        `np_rng` is a numpy.random.Generator (default: a fresh one).
+        """
+        import numpy as np
+
+        if np_rng is None:
+            np_rng = np.random.default_rng()
+        u = np_rng.random(k) * self.n
+        i = u.astype(np.int64)
+        prob = np.asarray(self._prob)
+        alias = np.asarray(self._alias, dtype=np.int64)
+        return self.start + np.where(u - i < prob[i], i, alias[i])
+
+    def probabilities(self) -> List[float]:
+        """
+        The distribution the table encodes (for checks and analysis).
+        """
+        p = [0.0] * self.n
+        for i in range(self.n):  # the sentinel column is never hit
+            p[i] += self._prob[i] / self.n
+            p[self._alias[i]] += (1.0 - self._prob[i]) / self.n
+        return p
+
+
+class AffineSampler:
+    """
+    Weighted sampler over outcomes start..start+n-1 whose weights have
+    the form w_i = b_i + k_i * x: a per-index base and slope, and one
+    global x that every weight follows.
+
+    b and k live in two Fenwick trees and the whole weight vector in one
+    global scale factor, so point updates to b_i or k_i, draws and total()
+    are O(log n), while advancing x or rescaling every weight is O(1).
+    Callers must keep every w_i non-negative (b_i may go negative as long
+    as k_i * x makes up for it). Draws follow random.choices: outcome i
+    is picked when a uniform point in [0, total) falls in its slice of
+    the cumulative weights.
+    """
+
+    # Fold the global scale back into the trees once it drifts this far
+    _RESCALE_LIMIT = 1e150
+
+    __slots__ = ("n", "start", "_base", "_slope", "_scale", "_y", "_top")
+
+    def __init__(self, base: Sequence[float], start: int = 1) -> None:
+        self.n = len(base)
+        self.start = start
+        # w_i = scale * (b_i + k_i * y), i.e. x = scale * y
+        self._scale = 1.0
+        self._y = 0.0
+        self._base = self._build(base)
+        self._slope = [0.0] * (self.n + 1)
+        top = 1
+        while top * 2 <= self.n:
+            top *= 2
+        self._top = top
+
+    def _build(self, values: Sequence[float]) -> List[float]:
+        # O(n) Fenwick construction
+        n = self.n
+        tree = [0.0] * (n + 1)
+        for i, v in enumerate(values, 1):
+            tree[i] += v
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        return tree
+
+    @staticmethod
+    def _prefix(tree: List[float], i: int) -> float:
+        s = 0.0
+        while i > 0:
+            s += tree[i]
+            i -= i & -i
+        return s
+
+    @staticmethod
+    def _add(tree: List[float], i: int, delta: float) -> None:
+        n = len(tree) - 1
+        j = i + 1
+        while j <= n:
+            tree[j] += delta
+            j += j & -j
+
+    @property
+    def x(self) -> float:
+        return self._scale * self._y
+
+    def weight(self, i: int) -> float:
+        """
+        Current weight of index i (0-based), O(log n).
+        """
+        b = self._prefix(self._base, i + 1) - self._prefix(self._base, i)
+        k = self._prefix(self._slope, i + 1) - self._prefix(self._slope, i)
+        return self._scale * (b + k * self._y)
+
+    def weights(self) -> List[float]:
+        """
+        All current weights, O(n log n).
+        """
+        return [self.weight(i) for i in range(self.n)]
+
+    def add_base(self, i: int, delta: float) -> None:
+        """
+        b_i += delta, O(log n).
+        """
+        self._add(self._base, i, delta / self._scale)
+
+    def add_slope(self, i: int, delta: float) -> None:
+        """
+        k_i += delta, O(log n). The weight moves by delta * x.
+        """
+        self._add(self._slope, i, delta)
+
+    def advance(self, dx: float) -> None:
+        """
+        x += dx: every weight moves by k_i * dx, O(1).
+        """
+        self._y += dx / self._scale
+
+    def scale(self, factor: float) -> None:
+        """
+        Multiply every weight (and x) by `factor` (> 0), O(1) amortized.
+        """
+        s = self._scale * factor
+        if s < 1.0 / self._RESCALE_LIMIT or s > self._RESCALE_LIMIT:
+            n = self.n
+            base = self._base
+            self._base = self._build(
+                [(self._prefix(base, i + 1) - self._prefix(base, i)) * s for i in range(n)]
+            )
+            self._y *= s
+            s = 1.0
+        self._scale = s
+
+    def total(self) -> float:
+        n = self.n
+        return self._scale * (self._prefix(self._base, n) + self._prefix(self._slope, n) * self._y)
+
+    def sample(self, rng=random) -> int:
+        """
+        One draw, O(log n).
+        """
+        base, slope, y = self._base, self._slope, self._y
+        n = self.n
+        target = rng.random() * (self._prefix(base, n) + self._prefix(slope, n) * y)
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt <= n:
+                w = base[nxt] + slope[nxt] * y
+                if w <= target:
+                    pos = nxt
+                    target -= w
+            step >>= 1
+        # pos = number of outcomes whose cumulative weight is <= target
+        return self.start + min(pos, n - 1)
+
+
+class OffsetPrefixTree:
+    """
+    Values v_i = a_i - c, where the a_i change by point updates and c is
+    one global offset that only grows (shift). Answers "first index whose
+    prefix sum reaches x" in O(log n), even when some v_i are negative,
+    i.e. exactly what a linear cumulative walk `if x <= cum: return i`
+    would return.
+
+    Implemented as a kinetic segment tree: every node keeps its best
+    (largest) prefix sum as a line in c plus the offset at which another
+    prefix would overtake it, so a shift only recomputes the nodes whose
+    best prefix actually changed (amortized O(log^2 n) per shift).
+    Exact with integer a_i and c.
+    """
+
+    __slots__ = ("n", "c", "_size", "_sum", "_len", "_best", "_bestk", "_melt")
+
+    def __init__(self, values: Sequence[float], offset: float = 0) -> None:
+        n = len(values)
+        size = 1
+        while size < n:
+            size *= 2
+        self.n = n
+        self.c = offset
+        self._size = size
+        inf = float("inf")
+        # Padding leaves hold a = 0, so they only ever lower prefix sums
+        self._sum = [0] * (2 * size)
+        self._len = [1] * (2 * size)
+        self._best = [0] * (2 * size)
+        self._bestk = [1] * (2 * size)
+        self._melt = [inf] * (2 * size)
+        for i, a in enumerate(values):
+            self._sum[size + i] = a
+            self._best[size + i] = a
+        for node in range(size - 1, 0, -1):
+            self._len[node] = self._len[2 * node] + self._len[2 * node + 1]
+            self._pull(node)
+
+    def _pull(self, node: int) -> None:
+        L = 2 * node
+        R = L + 1
+        c = self.c
+        a1, k1 = self._best[L], self._bestk[L]
+        a2, k2 = self._sum[L] + self._best[R], self._len[L] + self._bestk[R]
+        self._sum[node] = self._sum[L] + self._sum[R]
+        melt = min(self._melt[L], self._melt[R])
+        if a1 - k1 * c >= a2 - k2 * c:
+            # k1 < k2: the longer prefix only falls further behind as c grows
+            self._best[node], self._bestk[node] = a1, k1
+        else:
+            self._best[node], self._bestk[node] = a2, k2
+            melt = min(melt, (a2 - a1) / (k2 - k1))
+        self._melt[node] = melt
+
+    def _fix(self, node: int) -> None:
+        if node >= self._size:
+            return
+        for child in (2 * node, 2 * node + 1):
+            if self._melt[child] <= self.c:
+                self._fix(child)
+        self._pull(node)
+
+    def add(self, i: int, delta: float) -> None:
+        """
+        a_i += delta, O(log n).
+        """
+        node = self._size + i
+        self._sum[node] += delta
+        self._best[node] += delta
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def shift(self, dc: float) -> None:
+        """
+        c += dc (dc >= 0): lowers every value by dc.
+        """
+        if dc < 0:
+            raise ValueError("OffsetPrefixTree offset can only grow")
+        self.c += dc
+        if self._melt[1] <= self.c:
+            self._fix(1)
+
+    def value(self, i: int) -> float:
+        return self._sum[self._size + i] - self.c
+
+    def total(self) -> float:
+        return self._sum[1] - self.n * self.c
+
+    def first_at_least(self, x: float):
+        """
+        Smallest 0-based i with v_0 + ... + v_i >= x, or None.
+        """
+        c = self.c
+        if self._best[1] - self._bestk[1] * c < x:
+            return None
+        node = 1
+        acc = 0
+        size = self._size
+        best, bestk, sums, lens = self._best, self._bestk, self._sum, self._len
+        while node < size:
+            L = 2 * node
+            if acc + best[L] - bestk[L] * c >= x:
+                node = L
+            else:
+                acc += sums[L] - lens[L] * c
+                node = L + 1
+        return node - size
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Optional, Protocol
 
 from .types import MatchResult, Observation
 
@@ -17,6 +17,26 @@ class Strategy(Protocol):
     - reset(N)
     - act(obs) -> int
     - on_result(result)
+
+    Optional attributes:
+    - history_window: how much history act() needs.
+        None (or attribute absent) -> full history
+        0                          -> no history (histories are empty)
+        k > 0                      -> only the last k moves
+      The match keeps only what the strategies in it ask for, so
+      matches where neither side reads history run in constant memory.
+    - rng: where the strategy draws its randomness from. Declare
+      `rng = random` (the module) as a class attribute and call
+      self.rng.random(), self.rng.randint(...), ... instead of the random
+      module. Seeded matches then replace it with a private generator
+      per strategy (shared.rng.BlockRandom), so results are reproducible
+      whatever the opponent draws and however matches are scheduled.
+    - bid_distribution() -> list of N weights: the distribution act()
+      currently draws from (weights of bids 1..N, need not sum to 1).
+      shared.analytic computes exact expected payoffs from it.
+    - stationary: True if bid_distribution() never changes during a
+      match (the strategy ignores results). Tournaments with
+      MatchConfig.analytic then score its matches without playing them.
     """
 
     # Human-readable strategy name (used for printing)
@@ -52,3 +72,13 @@ class Strategy(Protocol):
         - update learning statistics
         """
         ...
+
+
+def history_window(strategy: object) -> Optional[int]:
+    """
+    History a strategy asked for (see Strategy.history_window).
+    """
+    window = getattr(strategy, "history_window", None)
+    if window is not None and window < 0:
+        raise ValueError(f"history_window must be >= 0, got {window}")
+    return window
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import List, Optional, Tuple
+
+# File layout: one fixed 128-byte header, then one record per round.
+# A record is five little-endian int32s: t, bid_a, bid_b, pay_a, pay_b.
+# The record count is never stored: it follows from the file size, so a
+# trace cut short by a crash is still readable up to its last full chunk.
+MAGIC = b"CASTRACE"
+VERSION = 1
+_HEADER = struct.Struct("<8sII52s52s8x")  # magic, version, N, name A, name B
+HEADER_SIZE = _HEADER.size
+FIELDS = ("t", "bid_a", "bid_b", "pay_a", "pay_b")
+RECORD_SIZE = 4 * len(FIELDS)
+
+
+def _encode_name(name: str) -> bytes:
+    raw = name.encode("utf-8")[:52]
+    # Never cut a multi-byte character in half
+    return raw.decode("utf-8", "ignore").encode("utf-8")
+
+
+class TraceWriter:
+    """
+    Streams per-round records of one match into a binary trace file.
+
+    Rounds are buffered in a typed array and written in chunks of
+    `chunk_rounds`, so recording costs one array extend per round and
+    memory stays bounded however long the match runs.
+
+    With start_round > 0 an existing trace is continued instead: records
+    past that round (written after the last checkpoint) are dropped.
+    """
+
+    __slots__ = ("path", "_f", "_buf", "_limit")
+
+    def __init__(self, path: str, N: int, name_a: str, name_b: str,
+                 chunk_rounds: int = 1 << 16, start_round: int = 0) -> None:
+        self.path = path
+        if start_round:
+            self._f = open(path, "r+b")
+            self._f.truncate(HEADER_SIZE + start_round * RECORD_SIZE)
+            self._f.seek(0, 2)
+        else:
+            self._f = open(path, "wb")
+            self._f.write(_HEADER.pack(MAGIC, VERSION, N, _encode_name(name_a), _encode_name(name_b)))
+        self._buf = array("i")
+        self._limit = len(FIELDS) * chunk_rounds
+
+    def record(self, t: int, a: int, b: int, pa: int, pb: int) -> None:
+        buf = self._buf
+        buf.extend((t, a, b, pa, pb))
+        if len(buf) >= self._limit:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            if sys.byteorder == "big":
+                self._buf.byteswap()
+            self._buf.tofile(self._f)
+            self._buf = array("i")
+        self._f.flush()
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self.flush()
+            self._f.close()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Trace:
+    """
+    A trace file memory-mapped as NumPy arrays (numpy is only needed
+    here, not for writing). Columns are read lazily from disk, so traces
+    far larger than RAM can be sliced and reduced.
+    """
+
+    def __init__(self, path: str) -> None:
+        import numpy as np
+
+        with open(path, "rb") as f:
+            head = f.read(HEADER_SIZE)
+        if len(head) < HEADER_SIZE:
+            raise ValueError(f"{path!r} is not a round trace (short header)")
+        magic, version, N, name_a, name_b = _HEADER.unpack(head)
+        if magic != MAGIC:
+            raise ValueError(f"{path!r} is not a round trace")
+        if version != VERSION:
+            raise ValueError(f"Unsupported trace version {version} in {path!r}")
+
+        self.path = path
+        self.N = N
+        self.names = (name_a.rstrip(b"\0").decode("utf-8"), name_b.rstrip(b"\0").decode("utf-8"))
+        dtype = np.dtype([(name, "<i4") for name in FIELDS])
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            rounds = (f.tell() - HEADER_SIZE) // RECORD_SIZE
+        if rounds:
+            self.records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(rounds,))
+        else:
+            self.records = np.zeros(0, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def column(self, name: str):
+        """
+        One field ("t", "bid_a", "bid_b", "pay_a", "pay_b") as an array view.
+        """
+        return self.records[name]
+
+    def bids(self, side: str = "A"):
+        return self.records["bid_a" if side == "A" else "bid_b"]
+
+    def payoffs(self, side: str = "A"):
+        return self.records["pay_a" if side == "A" else "pay_b"]
+
+
+def open_trace(path: str) -> Trace:
+    return Trace(path)
+
+
+# Reductions below walk the trace in blocks of this many rounds, so only
+# one block is ever paged in and converted at a time.
+_BLOCK = 1 << 20
+
+
+def bid_histogram(trace: Trace, side: str = "A", start: int = 0, stop: Optional[int] = None):
+    """
+    Count of each bid 1..N by one side over rounds [start, stop)
+    (0-based record positions), as an int64 array of length N.
+    """
+    import numpy as np
+
+    bids = trace.bids(side)
+    stop = len(bids) if stop is None else min(stop, len(bids))
+    counts = np.zeros(trace.N + 1, dtype=np.int64)
+    for lo in range(start, stop, _BLOCK):
+        counts += np.bincount(bids[lo:min(lo + _BLOCK, stop)], minlength=trace.N + 1)
+    return counts[1:]
+
+
+def windowed_payoff(trace: Trace, window: int, side: str = "A"):
+    """
+    Mean payoff per round of one side over consecutive, non-overlapping
+    windows of `window` rounds (a trailing partial window is dropped).
+    """
+    import numpy as np
+
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    pay = trace.payoffs(side)
+    n_windows = len(pay) // window
+    out = np.empty(n_windows, dtype=np.float64)
+    per_block = max(1, _BLOCK // window)
+    for w in range(0, n_windows, per_block):
+        w_stop = min(w + per_block, n_windows)
+        chunk = np.asarray(pay[w * window:w_stop * window], dtype=np.int64)
+        out[w:w_stop] = chunk.reshape(-1, window).sum(axis=1) / window
+    return out
+
+
+def detect_regimes(trace: Trace, window: int, threshold: float,
+                   side: str = "A") -> List[Tuple[int, int, float]]:
+    """
+    Split the match into regimes of steady play by one side: a new
+    regime starts at the first window whose mean bid differs from the
+    running mean of the current regime by more than `threshold`.
+
+    Returns (first round, last round, mean bid) per regime, with rounds
+    as recorded in the trace's t column.
+    """
+    import numpy as np
+
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    bids = trace.bids(side)
+    t = trace.column("t")
+    n = len(bids)
+    if n == 0:
+        return []
+
+    # Mean bid per window (the last window may be shorter)
+    means: List[float] = []
+    step = max(window, _BLOCK - _BLOCK % window)  # whole windows per block
+    for lo in range(0, n, step):
+        chunk = np.asarray(bids[lo:min(lo + step, n)], dtype=np.int64)
+        full = len(chunk) // window * window
+        if full:
+            means.extend((chunk[:full].reshape(-1, window).sum(axis=1) / window).tolist())
+        if full < len(chunk):
+            means.append(float(chunk[full:].mean()))
+
+    regimes: List[Tuple[int, int, float]] = []
+    first = 0       # first window of the current regime
+    total = 0.0     # sum of bids in the current regime
+    count = 0
+    for k, m in enumerate(means):
+        size = min(window, n - k * window)
+        if count and abs(m - total / count) > threshold:
+            regimes.append((int(t[first * window]), int(t[k * window - 1]), total / count))
+            first, total, count = k, 0.0, 0
+        total += m * size
+        count += size
+    regimes.append((int(t[first * window]), int(t[n - 1]), total / count))
+    return regimes
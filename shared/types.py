@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Sequence
 
 
 @dataclass(frozen=True)
@@ -14,9 +14,11 @@ class Observation:
     self_name: str
     opponent_name: str
 
-    # Full history against this opponent (chronological)
-    opp_action_history: Tuple[int, ...]
-    self_action_history: Tuple[int, ...]
+    # Full history against this opponent (chronological).
+    # Read-only sequences (see shared.history.HistoryView): index, slice,
+    # len and iterate them like tuples.
+    opp_action_history: Sequence[int]
+    self_action_history: Sequence[int]
 
 
 @dataclass(frozen=True)
@@ -35,4 +37,44 @@ class MatchResult:
 
     # Payoffs from THIS round only
     self_payoff: int
-    opp_payoff: int
\ No newline at end of file
+    opp_payoff: int
+
+class ReusableObservation:
+    """
+    Mutable, slotted twin of Observation used by the fast round loop
+    (MatchConfig.fast). The match overwrites the same instance every
+    round, so a strategy must not keep a reference to it past act().
+    """
+    __slots__ = ("N", "t", "self_name", "opponent_name",
+                 "opp_action_history", "self_action_history")
+
+    def __init__(self, N: int, t: int, self_name: str, opponent_name: str,
+                 opp_action_history: Sequence[int],
+                 self_action_history: Sequence[int]) -> None:
+        self.N = N
+        self.t = t
+        self.self_name = self_name
+        self.opponent_name = opponent_name
+        self.opp_action_history = opp_action_history
+        self.self_action_history = self_action_history
+
+
+class ReusableMatchResult:
+    """
+    Mutable, slotted twin of MatchResult used by the fast round loop.
+    Overwritten every round; do not keep a reference past on_result().
+    """
+    __slots__ = ("N", "t", "self_name", "opponent_name",
+                 "self_action", "opp_action", "self_payoff", "opp_payoff")
+
+    def __init__(self, N: int, t: int, self_name: str, opponent_name: str,
+                 self_action: int, opp_action: int,
+                 self_payoff: int, opp_payoff: int) -> None:
+        self.N = N
+        self.t = t
+        self.self_name = self_name
+        self.opponent_name = opponent_name
+        self.self_action = self_action
+        self.opp_action = opp_action
+        self.self_payoff = self_payoff
+        self.opp_payoff = opp_payoff
@@ -1,5 +1,7 @@
 # Random strategy: chooses a random bid every round
 
+from __future__ import annotations
+
 import random
 
 from shared.types import MatchResult, Observation
@@ -7,12 +9,35 @@ from shared.types import MatchResult, Observation
 
 class RandomBid:
     name = "RandomBid"
+    history_window = 0
+    rng = random
 
     def reset(self, *, N: int) -> None:
         self.N = N
 
     def act(self, obs: Observation) -> int:
-        return random.randint(1, self.N)
+        return self.rng.randint(1, self.N)
+
+    # Same distribution every round (see shared/analytic.py)
+    stationary = True
+
+    def bid_distribution(self) -> list[float]:
+        return [1.0 / self.N] * self.N
 
     def on_result(self, result: MatchResult) -> None:
         pass
+
+    # Optional batched interface (see shared/batch.py): B copies at once.
+    def reset_batch(self, *, N: int, B: int) -> None:
+        import numpy as np
+
+        self.N = N
+        self.B = B
+        # Seeded from self.rng, so a seeded BatchedMatch is reproducible
+        self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+
+    def act_batch(self, t: int):
+        return self._np_rng.integers(1, self.N + 1, size=self.B)
+
+    def on_result_batch(self, t, self_actions, opp_actions, self_payoffs, opp_payoffs) -> None:
+        pass
@@ -5,8 +5,12 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Deque
 
+from shared.sampling import AliasTable
 from shared.types import MatchResult, Observation
 
+# Low bids {1,2,3} with probs {0.15,0.50,0.35}
+_LOW_BIDS = AliasTable([0.15, 0.50, 0.35])
+
 
 @dataclass
 class _Mem:
@@ -19,6 +23,8 @@ class _Mem:
 # if the opponent repeatedly bids low.
 class G2:
     name = "G2"
+    history_window = 0
+    rng = random
 
     def __init__(self) -> None:
         self.N = 0
@@ -35,14 +41,7 @@ class G2:
             return 1
 
         # sample from {1,2,3} with probs {0.15,0.50,0.35}
-        x = random.random()
-        if x < 0.15:
-            a = 1
-        elif x < 0.65:
-            a = 2
-        else:
-            a = 3
-        return min(a, obs.N)
+        return min(_LOW_BIDS.sample(self.rng), obs.N)
 
     def on_result(self, result: MatchResult) -> None:
         assert self.mem is not None
@@ -1,28 +1,89 @@
 import math
 import random
+from bisect import bisect_left
 from collections import deque
-from typing import Deque
+from functools import lru_cache
+from typing import Deque, List, Tuple
 
 from shared.types import MatchResult, Observation
 
+
+@lru_cache(maxsize=None)
+def kernel_radius(sigma: float, tail_mass: float) -> int:
+    """
+    Smallest K such that the Gaussian kernel's weight more than K bids
+    away from floor(mu) is at most `tail_mass` of its total, for any mu.
+    """
+    # Total weight is at least the weight of the nearest bid, >= exp(-1/(8 sigma^2))
+    budget = tail_mass * math.exp(-1.0 / (8 * sigma ** 2))
+    two_var = 2 * sigma ** 2
+
+    # Weights at distance 0, 1, 2, ... until the rest is provably negligible:
+    # sum_{i >= j} exp(-i^2 / 2s^2) <= exp(-j^2 / 2s^2) * (1 + s^2 / j)
+    terms = []
+    j = 0
+    while True:
+        term = math.exp(-(j * j) / two_var)
+        if j > 0 and term * (1 + sigma ** 2 / j) < 1e-3 * budget:
+            rest = term * (1 + sigma ** 2 / j)
+            break
+        terms.append(term)
+        j += 1
+
+    # Both tails together lie beyond distance K
+    K = len(terms)
+    tail = 2 * rest
+    while K > 0 and tail + 2 * terms[K - 1] <= budget:
+        K -= 1
+        tail += 2 * terms[K]
+    return K
+
+
+@lru_cache(maxsize=None)
+def _kernel(sigma: float, tail_mass: float, r: int, L: int) -> Tuple[int, List[float]]:
+    """
+    (K, cumulative weights) of the kernel around mu = m + r/L for offsets
+    -K..K from m. Depends only on the fractional part of mu, so one
+    table per r/L serves every round.
+    """
+    K = kernel_radius(sigma, tail_mass)
+    frac = r / L
+    cum = []
+    total = 0.0
+    for k in range(-K, K + 1):
+        # Relative to the nearest bid's weight, so nothing underflows for small sigma
+        d = (k - frac) ** 2 - min(frac, 1 - frac) ** 2
+        total += math.exp(-d / (2 * sigma ** 2))
+        cum.append(total)
+    return K, cum
+
+
 class G3:
     """
     Implementation of Group 3's strategy: Probabilistic Tit-for-Tat.
     """
     name = "G3_ProbTFT"
+    history_window = 0
+    rng = random
 
-    def __init__(self, history_len: int = 10, sigma: float = 1.5) -> None:
+    def __init__(self, history_len: int = 10, sigma: float = 1.5, tail_mass: float = 1e-12) -> None:
         """
         Args:
             history_len (int): Size of the sliding window (n).
             sigma (float): Standard deviation for the Gaussian distribution.
                            Controls exploration vs imitation.
+            tail_mass (float): Probability mass the kernel may drop far from mu
+                           (bounds the error of sampling from a truncated window).
         """
         self.N = 0
+        self.history_len = history_len
         self.n = history_len
         self.sigma = sigma
+        self.tail_mass = tail_mass
         # Sliding window for observations
         self.history: Deque[int] = deque(maxlen=self.n)
+        # Running sum of the window
+        self.history_sum = 0
 
     def reset(self, *, N: int) -> None:
         """
@@ -30,43 +91,35 @@ class G3:
         """
         self.N = N
         self.history.clear()
+        self.history_sum = 0
 
     def act(self, obs: Observation) -> int:
         """
         Decides the bid for the current round.
         """
-        # 1. Calculate estimated opponent tendency (mu)
+        # 1. Calculate estimated opponent tendency (mu), as the exact fraction s / L
         if len(self.history) == 0:
             # Initial estimate: median of action set
-            mu = (self.N + 1) / 2
+            s, L = self.N + 1, 2
         else:
             # Empirical mean of history
-            mu = sum(self.history) / len(self.history)
+            s, L = self.history_sum, len(self.history)
+        m = s // L  # floor(mu), always a valid bid
 
-        # 2. Calculate weights and total weight for normalization
-        # Formula: w(i) = exp( - (i - mu)^2 / (2 * sigma^2) )
-        weights = []
-        total_weight = 0.0
-        
-        for i in range(1, self.N + 1):
-            w = math.exp(-((i - mu) ** 2) / (2 * self.sigma ** 2))
-            weights.append(w)
-            total_weight += w
-
-        # 3. Sample from the distribution (Cumulative Probability)
-        u = random.random() # Uniform(0, 1)
-        current_sum = 0.0
-        
-        for i in range(1, self.N + 1):
-            # Normalized probability f(i) = w(i) / total_weight
-            prob = weights[i-1] / total_weight
-            current_sum += prob
-            
-            # Choose smallest i such that sum >= u
-            if current_sum >= u:
-                return i
-        
-        return self.N # Fallback (should not be reached due to float precision)
+        # 2. Kernel w(i) = exp( - (i - mu)^2 / (2 * sigma^2) ) around m, truncated
+        # to the bids that carry all but tail_mass of it and cached per frac(mu)
+        K, cum = _kernel(self.sigma, self.tail_mass, s % L, L)
+
+        # Clip the window to 1..N (cum[j] covers offsets -K..j-K)
+        lo = max(0, K + 1 - m)
+        hi = min(2 * K, K + self.N - m)
+        base = cum[lo - 1] if lo > 0 else 0.0
+
+        # 3. Sample from the distribution (Cumulative Probability):
+        # smallest i such that the cumulative weight reaches u * total
+        u = self.rng.random() # Uniform(0, 1)
+        j = bisect_left(cum, base + u * (cum[hi] - base), lo, hi)
+        return m + j - K
 
     def on_result(self, result: MatchResult) -> None:
         """
@@ -85,4 +138,7 @@ class G3:
             o_r = i_r
 
         # Append observation to sliding window (auto-removes oldest if full)
-        self.history.append(o_r)
\ No newline at end of file
+        if self.history and len(self.history) == self.n:
+            self.history_sum -= self.history[0]
+        self.history.append(o_r)
+        self.history_sum += o_r
\ No newline at end of file
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
 import random
+from functools import lru_cache
 
+from shared.sampling import AliasTable
 from shared.types import Observation, MatchResult
 
 
 class G4:
     name: str = 'G4'
+    history_window: int = 0
+    rng = random
     j : int
     totalRounds : int
 
@@ -53,46 +59,37 @@ class G4:
         else:
             self.mode = self.Mode.NEUTRAL
 
+    def bid_distribution(self) -> list[float]:
+        # Current mode's distribution (unnormalized)
+        return mode_weights(self.mode, self.N)
+
     def act_aggressive(self) -> int:
-        actions = list(range(1, self.N + 1))
-        for i in range(self.N//2):
-            actions[i] = 1.0 / pow(actions[i], 3)
-        for i in range(self.N//2, self.N):
-            actions[i] = 0.0
-        distribution = self.calculate_distribution(actions)
-        return self.calculate_action(distribution)
+        return _mode_table(self.Mode.AGGRESSIVE, self.N).sample(self.rng)
 
     def act_neutral(self) -> int:
-        actions = list(range(1, self.N + 1))
-        start = self.N // 4
-        end = 3 * self.N // 4
-        for i in range(start, end):
-            actions[i] = 1.0 / pow(actions[i], 3)
-        # alles andere = 0
-        for i in range(0, start):
-            actions[i] = 0.0
-        for i in range(end, self.N):
-            actions[i] = 0.0
-        distribution = self.calculate_distribution(actions)
-        return self.calculate_action(distribution)
+        return _mode_table(self.Mode.NEUTRAL, self.N).sample(self.rng)
 
     def act_patient(self) -> int:
-        actions = list(range(1, self.N + 1))
-        start = self.N // 2
-        for i in range(start, self.N):
-            actions[i] = 1.0 / pow(actions[i], 3)
-        # alles andere = 0
-        for i in range(0, start):
-            actions[i] = 0.0
-        distribution = self.calculate_distribution(actions)
-        return self.calculate_action(distribution)
-
-    def calculate_distribution(self, actions: list[int]) -> list[float]:
-        total = sum(actions)
-        return [x / total for x in actions]
-
-    def calculate_action(self, distribution: list[float]) -> int:
-        N = len(distribution)
-
-        # Ziehe eine Aktion basierend auf Wahrscheinlichkeiten
-        return random.choices(range(N), weights=distribution, k=1)[0] + 1
+        return _mode_table(self.Mode.PATIENT, self.N).sample(self.rng)
+
+
+def mode_weights(mode: int, N: int) -> list[float]:
+    """
+    Unnormalized bid weights of a mode: 1/bid^3 on the mode's band, 0 elsewhere.
+    """
+    actions = [0.0] * N  # alles andere = 0
+    if mode == G4.Mode.AGGRESSIVE:
+        start, end = 0, N // 2
+    elif mode == G4.Mode.NEUTRAL:
+        start, end = N // 4, 3 * N // 4
+    else:
+        start, end = N // 2, N
+    for i in range(start, end):
+        actions[i] = 1.0 / pow(i + 1, 3)
+    return actions
+
+
+@lru_cache(maxsize=None)
+def _mode_table(mode: int, N: int) -> AliasTable:
+    # Built once per (mode, N), then every move is an O(1) draw
+    return AliasTable(mode_weights(mode, N))
@@ -1,49 +1,55 @@
 import random
 
+from shared.sampling import OffsetPrefixTree
 from shared.types import MatchResult, Observation
 
 
 class G5:
     name = "G5"
+    history_window = 0
+    rng = random
 
     def reset(self, *, N: int) -> None:
         self.N = N
 
-        # Start with uniform distribution
-        self.probs = [0.0] + [1.0 / N for _ in range(N)]
+        # Start with uniform distribution.
+        # Scaled by N^2 the distribution is integral: N^2 * p_i = N * (1 + wins_i) - wins,
+        # so a win is one point update (+N) and one global shift (-1 for everyone).
+        self.tree = OffsetPrefixTree([N] * N)
 
         self.last_self_action = None
 
         # print(f"[RESET] Initial distribution: {self._pretty_probs()}")
 
+    @property
+    def probs(self):
+        scale = 1.0 / (self.N * self.N)
+        return [0.0] + [self.tree.value(i) * scale for i in range(self.N)]
+
     def act(self, obs: Observation) -> int:
-        r = random.random()
-        cumulative = 0.0
+        r = self.rng.random()
 
-        for i in range(1, self.N + 1):
-            cumulative += self.probs[i]
-            if r <= cumulative:
-                self.last_self_action = i
-                return i
+        # first i whose cumulative probability reaches r (probabilities may go negative)
+        i = self.tree.first_at_least(r * self.N * self.N)
+        if i is None:
+            self.last_self_action = self.N
+            return self.N
 
-        self.last_self_action = self.N
-        return self.N
+        self.last_self_action = i + 1
+        return i + 1
 
     def on_result(self, result: MatchResult) -> None:
         if result.self_payoff <= 0:
             return  # only update when G5 wins
 
         winning_value = self.last_self_action
-        delta = 1.000 / (self.N * self.N)  # 1 / N^2
-
-        for i in range(1, self.N + 1):
-            if i != winning_value:
-                self.probs[i] -= delta
 
-        self.probs[winning_value] += (self.N - 1) * delta
+        # p_winner += (N-1)/N^2, everyone else -= 1/N^2
+        self.tree.add(winning_value - 1, self.N)
+        self.tree.shift(1)
 
         # DEBUG CHECK (optional but recommended)
-        total = sum(self.probs[1:])
+        # total = sum(self.probs[1:])
     #     print(
     #         f"[UPDATE] G5 WON with {winning_value} | "
     #         f"sum={round(total, 6)} | "
@@ -1,18 +1,101 @@
 from __future__ import annotations
 
 import random
+import sys
 from dataclasses import dataclass
 from typing import List
 
 from shared.types import MatchResult, Observation
 
+# Expected payoffs closer than this (relative, per bid of N) are left to the
+# original float computation, which decides near-ties by its rounding
+_TIE_TOL = 4 * sys.float_info.epsilon
+
+
+class _CountTree:
+    """
+    Segment tree over opponent bid counts (leaf i -> bid i+1): point
+    increments and suffix sums in O(log N), plus the branch-and-bound
+    search for the best bids used by Strategy6.act.
+    """
+
+    def __init__(self, N: int) -> None:
+        size = 1
+        while size < N:
+            size *= 2
+        self.N = N
+        self.size = size
+        self.sums = [0] * (2 * size)
+
+    def add(self, i: int) -> None:
+        node = self.size + i
+        while node:
+            self.sums[node] += 1
+            node //= 2
+
+    def greater(self, b: int) -> int:
+        """
+        Number of recorded bids > b.
+        """
+        sums = self.sums
+        node = self.size + b - 1
+        total = 0
+        while node > 1:
+            if node % 2 == 0:
+                total += sums[node + 1]
+            node //= 2
+        return total
+
+    def best_bids(self, floor: int, tol: float) -> List[int]:
+        """
+        All bids b whose score b * S(b), S(b) = sum_{j > b} (count_j + 1),
+        is within `tol` (relative) of the maximum. `floor` is any known
+        attainable score and only serves to prune.
+        """
+        N, size, sums = self.N, self.size, self.sums
+        best = floor
+        found = []
+        # (node, first bid, width, counts of bids after the node)
+        stack = [(1, 1, size, 0)]
+        while stack:
+            node, lo, width, after = stack.pop()
+            if lo > N:
+                continue
+            # Every bid b in the node has b <= hi and S(b) <= (N - lo) + after + sums[node]
+            hi = min(lo + width - 1, N)
+            if hi * ((N - lo) + after + sums[node]) < best * (1 - tol):
+                continue
+            if node >= size:
+                score = lo * ((N - lo) + after)
+                if score > best:
+                    best = score
+                found.append((score, lo))
+                continue
+            L = 2 * node
+            half = width // 2
+            # Right child popped first: it tends to hold the larger scores
+            stack.append((L, lo, half, after + sums[L + 1]))
+            stack.append((L + 1, lo + half, half, after))
+        cut = best * (1 - tol)
+        return [b for score, b in found if score >= cut]
+
 
 @dataclass
 class _Mem:
     # Counts of opponent actions (index 0 -> bid 1)
     opp_counts: List[int]
-    # Smoothed probability distribution over opponent bids
-    opp_probs: List[float]
+    # Running sum of opp_counts
+    opp_total: int
+    # Same counts, for suffix sums and the best-response search
+    tree: _CountTree
+    # Last best response (warm start for the next search)
+    best_b: int
+
+    @property
+    def opp_probs(self) -> List[float]:
+        # Smoothed probability distribution over opponent bids
+        total = self.opp_total + len(self.opp_counts)
+        return [(c + 1) / total for c in self.opp_counts]
 
 
 class Strategy6:
@@ -25,9 +108,18 @@ class Strategy6:
         payoff(b) = b * P(opponent_bid > b)
 
     Uses epsilon-greedy to occasionally explore.
+
+    The model is kept incrementally: with add-one smoothing,
+    payoff(b) * (total + N) = b * S(b) with the integer S(b) = sum_{j > b} (count_j + 1),
+    so the best bid is found exactly by a branch-and-bound search over a
+    count tree instead of a full scan. Only when several bids score within
+    float rounding of each other does act fall back to the original float
+    scan, so the chosen bids stay the same as before.
     """
 
     name = "G6"
+    history_window = 0
+    rng = random
 
     def __init__(self, *, epsilon: float = 0.15) -> None:
         self.N: int = 0
@@ -38,15 +130,32 @@ class Strategy6:
         self.N = N
         self.mem = _Mem(
             opp_counts=[0 for _ in range(N)],
-            opp_probs=[1.0 / N for _ in range(N)],
+            opp_total=0,
+            tree=_CountTree(N),
+            best_b=1,
         )
 
     def act(self, obs: Observation) -> int:
         assert self.mem is not None
 
         # epsilon-greedy exploration
-        if random.random() < self.epsilon:
-            return random.randint(1, self.N)
+        if self.rng.random() < self.epsilon:
+            return self.rng.randint(1, self.N)
+
+        mem = self.mem
+        b = mem.best_b
+        floor = b * ((self.N - b) + mem.tree.greater(b))
+        candidates = mem.tree.best_bids(floor, _TIE_TOL * (self.N + 2))
+        if len(candidates) == 1:
+            best_b = candidates[0]
+        else:
+            best_b = self._float_argmax()
+        mem.best_b = best_b
+        return best_b
+
+    def _float_argmax(self) -> int:
+        # The original O(N) scan, kept bit-for-bit for near-ties
+        opp_probs = self.mem.opp_probs
 
         best_b = 1
         best_val = -1.0
@@ -56,7 +165,7 @@ class Strategy6:
         suffix_gt = [0.0] * self.N
         for i in range(self.N - 1, -1, -1):
             suffix_gt[i] = suffix_sum
-            suffix_sum += self.mem.opp_probs[i]
+            suffix_sum += opp_probs[i]
 
         for i in range(self.N):  # i=0 -> bid 1
             b = i + 1
@@ -73,7 +182,5 @@ class Strategy6:
         opp_bid = result.opp_action
         if 1 <= opp_bid <= self.N:
             self.mem.opp_counts[opp_bid - 1] += 1
-
-        # Dirichlet(1) prior (add-one smoothing)
-        total = sum(self.mem.opp_counts) + self.N
-        self.mem.opp_probs = [(c + 1) / total for c in self.mem.opp_counts]
+            self.mem.opp_total += 1
+            self.mem.tree.add(opp_bid - 1)
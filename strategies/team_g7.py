@@ -4,8 +4,10 @@ import math
 import random
 from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Deque
 
+from shared.sampling import AliasTable
 from shared.types import MatchResult, Observation
 
 
@@ -19,6 +21,8 @@ class _Memory:
 class G7:
 
     name = "G7"
+    history_window = 0
+    rng = random
 
     
     ALPHA = 0.75  # SAFE distribution decay parameter
@@ -32,8 +36,8 @@ class G7:
     def __init__(self) -> None:
         self.N = 0
         self.mem: _Memory | None = None
-        self.safe_dist: list[float] = []
-        self.risky_dist: list[float] = []
+        self.safe_table: AliasTable | None = None
+        self.risky_table: AliasTable | None = None
 
     def reset(self, *, N: int) -> None:
         """Initialize for a new match"""
@@ -43,41 +47,31 @@ class G7:
             payoff_history=deque(maxlen=3)  # Keep last 3 payoffs for transition logic
         )
 
-        # Precompute the probability distributions
-        self._compute_distributions()
+        # Precomputed probability distributions, shared by every G7 with this N
+        self.safe_table = _state_table("SAFE", N)
+        self.risky_table = _state_table("RISKY", N)
 
-    def _compute_distributions(self) -> None:
-        # dictates the use of safe or risky tatctin
-        # SAFE distribution (favors low values)
-        safe_unnormalized = [math.exp(-self.ALPHA * i) for i in range(1, self.N + 1)]
-        safe_sum = sum(safe_unnormalized)
-        self.safe_dist = [p / safe_sum for p in safe_unnormalized]
+    @property
+    def safe_dist(self) -> list[float]:
+        return state_distribution("SAFE", self.N)
 
-        # RISKY distribution (favors high values)
-        risky_unnormalized = [math.exp(self.BETA * i) for i in range(1, self.N + 1)]
-        risky_sum = sum(risky_unnormalized)
-        self.risky_dist = [p / risky_sum for p in risky_unnormalized]
+    @property
+    def risky_dist(self) -> list[float]:
+        return state_distribution("RISKY", self.N)
 
-    def _sample_from_distribution(self, distribution: list[float]) -> int:
-        r = random.random()
-        cumulative = 0.0
-
-        for i, prob in enumerate(distribution):
-            cumulative += prob
-            if r < cumulative:
-                return i + 1  # Actions are 1-indexed
-
-        return self.N  # Fallback (should not happen with proper probabilities)
 
+    def bid_distribution(self) -> list[float]:
+        assert self.mem is not None
+        return state_distribution(self.mem.state, self.N)
 
     #called for every round
     def act(self, obs: Observation) -> int:
         assert self.mem is not None
 
         if self.mem.state == "SAFE":
-            return self._sample_from_distribution(self.safe_dist)
+            return self.safe_table.sample(self.rng)
         else:  # RISKY
-            return self._sample_from_distribution(self.risky_dist)
+            return self.risky_table.sample(self.rng)
 
 
     def on_result(self, result: MatchResult) -> None:
@@ -107,3 +101,44 @@ class G7:
         elif mu > self.TAU_HIGH and sigma <= self.TAU_VAR:
             self.mem.state = "RISKY"
 
+
+def _state_support(state: str, N: int) -> tuple[int, list[float]]:
+    """
+    (first bid, probabilities) of a state's distribution over the bids
+    whose probability does not underflow to 0. SAFE decays like
+    exp(-ALPHA * i), RISKY grows like exp(BETA * i); both are normalized
+    in log space (log-sum-exp around the peak), so no N overflows.
+    """
+    rate = G7.ALPHA if state == "SAFE" else G7.BETA
+    # Log-weights relative to the peak bid (1 for SAFE, N for RISKY): -rate * k
+    rel = []
+    k = 0
+    while k < N:
+        w = math.exp(-rate * k)
+        if w == 0.0:
+            break
+        rel.append(w)
+        k += 1
+    log_z = math.log(sum(rel))
+    probs = [math.exp(-rate * k - log_z) for k in range(len(rel))]
+    if state == "SAFE":
+        return 1, probs
+    probs.reverse()
+    return N - len(probs) + 1, probs
+
+
+def state_distribution(state: str, N: int) -> list[float]:
+    """
+    Probabilities of bids 1..N in a state ("SAFE" or "RISKY").
+    """
+    start, probs = _state_support(state, N)
+    dist = [0.0] * N
+    dist[start - 1:start - 1 + len(probs)] = probs
+    return dist
+
+
+@lru_cache(maxsize=None)
+def _state_table(state: str, N: int) -> AliasTable:
+    # Built once per (state, N) over the support only, then every move is an O(1) draw
+    start, probs = _state_support(state, N)
+    return AliasTable(probs, start=start)
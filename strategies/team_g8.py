@@ -5,12 +5,15 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Deque, Protocol
 
+from shared.sampling import AffineSampler
 from shared.types import MatchResult, Observation
 
 
 class G8:
 
     name="G8"
+    history_window=0
+    rng = random
     ALPHA = 0.2
 
     def __init__(self)->None:
@@ -20,28 +23,25 @@ class G8:
     def reset(self, *, N: int) -> None:
 
         self.N = N
-        self.f = []
         self.rounds_played = 0
 
         self.wins = [0] * self.N
 
+        # f_i = b_i + wins_i * x: the win term of every bucket follows one global x
+        self.sampler = AffineSampler(initial_distribution(N))
 
-        for i in range(1, N + 1):
-            if i <= N // 2:
-                value = (2 / (N ** 2)) * i
-            else:
-                value = (2 / (N ** 2)) * (N - i + 1)
-            self.f.append(value)
+    @property
+    def f(self):
+        return self.sampler.weights()
 
-        #Normalization
-        total = sum(self.f)
-        self.f = [x / total for x in self.f]
+    def bid_distribution(self):
+        return self.f
 
 
     def act(self, obs: Observation) -> int:
 
-        actions = list(range(1, self.N + 1))
-        choice = random.choices(actions, weights=self.f, k=1)[0]
+        # same draw as random.choices(range(1, N + 1), weights=f), in O(log N)
+        choice = self.sampler.sample(self.rng)
         return choice
 
     def on_result(self, result: MatchResult) -> None:
@@ -52,22 +52,38 @@ class G8:
         b = result.opp_action
 
         if a < b:
-            self.wins[a - 1] += 1
+            self._win(a - 1)
         elif b < a:
-            self.wins[b - 1] += 1
+            self._win(b - 1)
 
-        p_win = [
-            self.wins[i] / self.rounds_played
-            for i in range(self.N)
-        ]
+        # f_i += ALPHA * p_win_i for every i at once (O(1): advance x)
+        sampler = self.sampler
+        sampler.advance(self.ALPHA / self.rounds_played)
 
-
-        self.f = [
-            self.f[i] + self.ALPHA * p_win[i]
-            for i in range(self.N)
-        ]
-
-        # Normalization
-        total = sum(self.f)
+        # Normalization (O(1): one global factor)
+        total = sampler.total()
         if total > 0:
-            self.f = [fi / total for fi in self.f]
+            sampler.scale(1.0 / total)
+
+    def _win(self, i: int) -> None:
+        # One more unit of x in f_i, offset so f_i itself doesn't move yet
+        self.wins[i] += 1
+        self.sampler.add_base(i, -self.sampler.x)
+        self.sampler.add_slope(i, 1)
+
+
+def initial_distribution(N: int) -> list[float]:
+    """
+    G8's starting distribution: triangular, peaking in the middle of 1..N.
+    """
+    f = []
+    for i in range(1, N + 1):
+        if i <= N // 2:
+            value = (2 / (N ** 2)) * i
+        else:
+            value = (2 / (N ** 2)) * (N - i + 1)
+        f.append(value)
+
+    #Normalization
+    total = sum(f)
+    return [x / total for x in f]
@@ -0,0 +1,197 @@
+import ast
+import importlib
+import importlib.util
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Entry point group other distributions register strategies under, e.g.
+# [project.entry-points."cas_a4.strategies"]  MyBot = "mybot.strategy:MyBot"
+ENTRY_POINT_GROUP = "cas_a4.strategies"
+
+
+@dataclass(frozen=True)
+class StrategyEntry:
+    """
+    A strategy known by name and import path only. Its module is imported
+    the first time load() is called, so listing and selecting strategies
+    costs no imports.
+    """
+    name: str
+    module: str
+    attr: str
+
+    def load(self) -> type:
+        return getattr(importlib.import_module(self.module), self.attr)
+
+    def create(self, **kwargs):
+        return self.load()(**kwargs)
+
+
+def _strategy_name(node: ast.ClassDef) -> Optional[str]:
+    # The string literal bound to `name` in the class body, if the class
+    # also defines the Strategy methods
+    name = None
+    methods = set()
+    for stmt in node.body:
+        if isinstance(stmt, ast.FunctionDef):
+            methods.add(stmt.name)
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            value = stmt.value
+            if (any(isinstance(t, ast.Name) and t.id == "name" for t in targets)
+                    and isinstance(value, ast.Constant) and isinstance(value.value, str)):
+                name = value.value
+    return name if {"reset", "act", "on_result"} <= methods else None
+
+
+@lru_cache(maxsize=None)
+def _scan_file(path: str, mtime: float) -> Tuple[Tuple[str, str], ...]:
+    # (strategy name, class name) per strategy class; re-parsed only when
+    # the file changes
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    found = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+            name = _strategy_name(node)
+            if name is not None:
+                found.append((name, node.name))
+    return tuple(found)
+
+
+def scan_package(package: str = "strategies") -> List[StrategyEntry]:
+    """
+    Strategies defined in the modules of `package`, by module name, found by
+    parsing their source: nothing is imported. A strategy is a public
+    top-level class that sets `name` to a string literal and defines
+    reset/act/on_result.
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ValueError(f"{package!r} is not a package")
+    entries = []
+    for directory in spec.submodule_search_locations:
+        for fname in sorted(os.listdir(directory)):
+            if not fname.endswith(".py") or fname.startswith("_"):
+                continue
+            path = os.path.join(directory, fname)
+            module = f"{package}.{fname[:-3]}"
+            for name, attr in _scan_file(path, os.path.getmtime(path)):
+                entries.append(StrategyEntry(name, module, attr))
+    return entries
+
+
+def entry_point_strategies(group: str = ENTRY_POINT_GROUP) -> List[StrategyEntry]:
+    """
+    Strategies installed under the entry point `group` ("module:Class";
+    the entry point name is the strategy name).
+    """
+    from importlib.metadata import entry_points  # slow to import; only needed here
+
+    entries = []
+    for ep in entry_points(group=group):
+        module, _, attr = ep.value.partition(":")
+        entries.append(StrategyEntry(ep.name, module.strip(), attr.strip()))
+    return entries
+
+
+class StrategyRegistry:
+    """
+    Strategies by name, in registration order. Entries are import paths
+    (StrategyEntry), so modules are only imported for the strategies a
+    caller actually loads.
+
+    With entry_points=True, installed plugins are looked up the first time
+    a name or pattern is not found among the known entries (or all names
+    are listed), so the common case never scans package metadata.
+    """
+
+    def __init__(self, entries: Iterable[StrategyEntry] = (), *, entry_points: bool = False,
+                 group: str = ENTRY_POINT_GROUP) -> None:
+        self._entries: Dict[str, StrategyEntry] = {}
+        self._group = group
+        self._plugins_pending = entry_points
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: StrategyEntry) -> None:
+        known = self._entries.get(entry.name)
+        if known is not None and known != entry:
+            raise ValueError(f"strategy name {entry.name!r} registered twice "
+                             f"({known.module}.{known.attr} and {entry.module}.{entry.attr})")
+        self._entries[entry.name] = entry
+
+    def register(self, cls: type, name: Optional[str] = None) -> type:
+        """
+        Add an already imported class (usable as a class decorator).
+        """
+        self.add(StrategyEntry(name or cls.name, cls.__module__, cls.__qualname__))
+        return cls
+
+    def _load_plugins(self) -> bool:
+        if not self._plugins_pending:
+            return False
+        self._plugins_pending = False
+        for entry in entry_point_strategies(self._group):
+            self.add(entry)
+        return True
+
+    def names(self) -> List[str]:
+        self._load_plugins()
+        return list(self._entries)
+
+    def __iter__(self) -> Iterator[StrategyEntry]:
+        self._load_plugins()
+        return iter(list(self._entries.values()))
+
+    def __len__(self) -> int:
+        self._load_plugins()
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries or (self._load_plugins() and name in self._entries)
+
+    def get(self, name: str) -> StrategyEntry:
+        if name not in self:
+            raise KeyError(f"unknown strategy {name!r} (known: {', '.join(self._entries)})")
+        return self._entries[name]
+
+    def select(self, *patterns: str, exclude: Iterable[str] = ()) -> List[StrategyEntry]:
+        """
+        Entries whose name matches any of the shell-style patterns
+        ("G*", "G[2-5]", "RandomBid"; all when none are given) and none of
+        `exclude`, in registration order. A pattern matching nothing is an
+        error, so typos do not silently shrink a tournament.
+        """
+        exclude = tuple(exclude)
+        chosen = []
+        for pattern in patterns or ("*",):
+            matched = [e for e in self._entries.values() if fnmatchcase(e.name, pattern)]
+            if not matched and self._load_plugins():
+                matched = [e for e in self._entries.values() if fnmatchcase(e.name, pattern)]
+            if not matched:
+                raise KeyError(f"no strategy matches {pattern!r} (known: {', '.join(self._entries)})")
+            chosen.extend(matched)
+        picked = {e.name for e in chosen if not any(fnmatchcase(e.name, x) for x in exclude)}
+        return [e for e in self._entries.values() if e.name in picked]
+
+    def classes(self, *patterns: str, exclude: Iterable[str] = ()) -> List[type]:
+        return [e.load() for e in self.select(*patterns, exclude=exclude)]
+
+    def create(self, *patterns: str, exclude: Iterable[str] = ()) -> list:
+        """
+        One fresh instance of every selected strategy.
+        """
+        return [e.create() for e in self.select(*patterns, exclude=exclude)]
+
+
+@lru_cache(maxsize=None)
+def registry(package: str = "strategies") -> StrategyRegistry:
+    """
+    Default registry: the strategies found in `package` (scanned once),
+    plus installed entry point plugins on demand.
+    """
+    return StrategyRegistry(scan_package(package), entry_points=True)
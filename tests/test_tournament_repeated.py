@@ -0,0 +1,54 @@
+from shared.match import MatchConfig
+from tournament_repeated import run_repeated_tournament
+
+
+class _Fixed:
+    history_window = 0
+
+    def __init__(self, bid: int = 1) -> None:
+        self.bid = bid
+        self.name = f"Fixed{bid}"
+
+    def reset(self, *, N: int) -> None:
+        pass
+
+    def act(self, obs) -> int:
+        return self.bid
+
+    def on_result(self, result) -> None:
+        pass
+
+
+CFG = MatchConfig(N=5, rounds=20, verbose=False)
+
+
+def test_unanimous_pairings_keep_nonzero_intervals():
+    # Fixed1 wins every round against Fixed2 and Fixed3: every repetition
+    # agrees, so a pooled normal approximation would give zero width.
+    stats, summaries = run_repeated_tournament(
+        [_Fixed(1), _Fixed(2), _Fixed(3)], CFG, seed=0, min_reps=5, max_reps=20)
+
+    assert summaries[("Fixed1", "Fixed2")].verdict == 1
+    assert summaries[("Fixed1", "Fixed2")].wins == summaries[("Fixed1", "Fixed2")].reps
+    for st in stats.values():
+        lo, hi = st.win_rate_ci
+        assert 0.0 <= lo <= st.win_rate <= hi <= 1.0
+        assert hi - lo > 0
+        plo, phi = st.points_ci
+        assert plo <= st.points <= phi
+        assert phi - plo > 0
+    assert stats["Fixed1"].win_rate == 1.0
+    assert stats["Fixed3"].win_rate == 0.0
+    assert stats["Fixed1"].win_rate_ci[0] < 1.0
+
+
+def test_draws_are_reported_and_not_counted_as_wins():
+    stats, summaries = run_repeated_tournament(
+        [_Fixed(2), _Fixed(2)], CFG, seed=0, min_reps=5, max_reps=10)
+
+    sm = summaries[("Fixed2", "Fixed2")]
+    assert sm.draws == sm.reps == 10
+    assert sm.decisive == 0
+    assert sm.verdict == 0
+    assert sm.win_rate_ci == (0.0, 1.0)
+    assert stats["Fixed2"].draws == 20
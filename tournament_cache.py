@@ -0,0 +1,167 @@
+import hashlib
+import inspect
+import math
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import shared.game
+
+DEFAULT_CACHE_DIR = ".match_cache"
+
+# Bump to invalidate every stored result when scores change for a reason
+# no hashed source shows (e.g. a new cache layout). Edits to shared/ or to
+# a strategy's file are picked up by spec_key on their own.
+CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def _file_hash(path: str, mtime_ns: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_hash(obj) -> str:
+    """
+    Hash of the source file that defines a strategy class (or module).
+    Editing the file changes the hash, so only that strategy's pairings
+    miss the cache.
+    """
+    path = inspect.getsourcefile(obj)
+    if path is None:
+        raise ValueError(f"Cannot locate source for {obj!r}")
+    return _file_hash(path, os.stat(path).st_mtime_ns)
+
+
+def engine_hash() -> str:
+    """
+    Combined hash of every module in shared/: the game rules, the match
+    engine and the samplers, RNG and history helpers strategies build on.
+    Editing any of them changes every key.
+    """
+    directory = os.path.dirname(os.path.abspath(shared.game.__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            path = os.path.join(directory, name)
+            digest.update(name.encode())
+            digest.update(_file_hash(path, os.stat(path).st_mtime_ns).encode())
+    return digest.hexdigest()
+
+
+def spec_key(spec) -> str:
+    """
+    Content address of a match: engine and strategy source hashes,
+    constructor params, N, rounds, seed and seat order (A first).
+    """
+    parts = (
+        CACHE_VERSION,
+        engine_hash(),
+        spec.a_cls.__module__, spec.a_cls.__qualname__, source_hash(spec.a_cls), spec.a_kwargs,
+        spec.b_cls.__module__, spec.b_cls.__qualname__, source_hash(spec.b_cls), spec.b_kwargs,
+        spec.cfg.N, spec.cfg.rounds, spec.seed,
+    )
+    if spec.cfg.analytic:  # expected scores, not a played match
+        parts += ("analytic",)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+class MatchCache:
+    """
+    Persistent on-disk store of match scores, keyed by spec_key().
+
+    Backed by one SQLite file. Only seeded specs are cached (unseeded
+    matches are not reproducible). When the file grows past max_bytes,
+    the least recently used results are evicted down to EVICT_TO of it
+    and the file is vacuumed to give the space back.
+    """
+
+    # Evict below the cap, so the vacuum is not repeated on every put
+    EVICT_TO = 0.9
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, max_bytes: int = 64 * 2**20) -> None:
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(os.path.join(path, "matches.sqlite3"))
+        # Scores are REAL: analytic matches store expected (fractional)
+        # scores. Tables from before that are dropped, not migrated.
+        columns = {row[1]: row[2] for row in self._db.execute("PRAGMA table_info(matches)")}
+        if columns and columns.get("score_a") != "REAL":
+            self._db.execute("DROP TABLE matches")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            " key TEXT PRIMARY KEY, score_a REAL, score_b REAL, used REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS matches_used ON matches(used)")
+        self._db.commit()
+
+    def get_many(self, specs) -> Dict[int, Tuple[float, float]]:
+        """
+        Cached scores for the cacheable specs, by position in `specs`.
+        """
+        found: Dict[int, Tuple[float, float]] = {}
+        now = time.time()
+        for i, spec in enumerate(specs):
+            if spec.seed is None:
+                continue
+            key = spec_key(spec)
+            row = self._db.execute(
+                "SELECT score_a, score_b FROM matches WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                continue
+            self.hits += 1
+            found[i] = (row[0], row[1])
+            self._db.execute("UPDATE matches SET used = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        return found
+
+    def put_many(self, specs, scores: List[Tuple[float, float]]) -> None:
+        now = time.time()
+        rows = [
+            (spec_key(spec), sa, sb, now)
+            for spec, (sa, sb) in zip(specs, scores)
+            if spec.seed is not None
+        ]
+        self._db.executemany("INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?)", rows)
+        self._evict()
+        self._db.commit()
+
+    def size(self) -> int:
+        """
+        Bytes the database occupies on disk.
+        """
+        (pages,) = self._db.execute("PRAGMA page_count").fetchone()
+        (page_size,) = self._db.execute("PRAGMA page_size").fetchone()
+        return pages * page_size
+
+    def _evict(self) -> None:
+        size = self.size()
+        if size <= self.max_bytes:
+            return
+        # Rows are close to equal in size: drop the share of them that
+        # brings the file down to EVICT_TO * max_bytes
+        (count,) = self._db.execute("SELECT COUNT(*) FROM matches").fetchone()
+        excess = math.ceil(count * (1 - self.EVICT_TO * self.max_bytes / size))
+        self._db.execute(
+            "DELETE FROM matches WHERE key IN"
+            " (SELECT key FROM matches ORDER BY used LIMIT ?)", (excess,)
+        )
+        self._db.commit()
+        self._db.execute("VACUUM")
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM matches")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
@@ -1,27 +1,33 @@
-from dataclasses import dataclass
+import hashlib
+import inspect
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from itertools import combinations
-from typing import Dict, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple, Union
 
 from shared.match import IteratedMatch, MatchConfig
-from strategies.team_g2 import G2
-from strategies.team_g3 import G3
-from strategies.team_g4 import G4
-from strategies.team_g5 import G5
-from strategies.team_g6 import Strategy6
-from strategies.team_g7 import G7
-from strategies.team_g8 import G8
-
-
-def make_strategies():
-    return [
-        G2(),
-        G3(),
-        G4(),
-        G5(),
-        Strategy6(),
-        G7(),
-        G8(),
-    ]
+from shared.analytic import expected_payoff, stationary_distribution
+from shared.checkpoint import load_checkpoint, remove_checkpoint, save_checkpoint
+from shared.observers import MatchObserver, hooks, round_hook
+from shared.profiling import StrategyProfile
+from shared.rng import derive_seed
+from strategy_registry import registry
+from tournament_cache import MatchCache, spec_key
+
+# What make_strategies() plays when no names are given: the team strategies
+DEFAULT_POOL = ("G*",)
+
+
+def make_strategies(*patterns: str, exclude: Sequence[str] = ()):
+    """
+    Fresh instances of the registered strategies matching the name
+    patterns (default: DEFAULT_POOL). Only the selected strategies'
+    modules are imported.
+    """
+    return registry().create(*(patterns or DEFAULT_POOL), exclude=exclude)
 
 
 @dataclass
@@ -32,69 +38,537 @@ class Stats:
     losses: int = 0
     draws: int = 0
     matches: int = 0
+    # Isolated runs only: matches lost by forfeit, moves lost to timeouts
+    forfeits: int = 0
+    timeouts: int = 0
+    # Time/memory spent inside this strategy (only filled when profiling)
+    profile: StrategyProfile = field(default_factory=StrategyProfile)
 
     @property
     def diff(self) -> float:
         return self.points_for - self.points_against
 
 
+@dataclass(frozen=True)
+class MatchSpec:
+    """
+    One match to play: strategy classes in seat order, config and seed.
+    Specs are plain picklable data so they can be shipped to workers.
+    """
+    a_cls: type
+    b_cls: type
+    cfg: MatchConfig
+    seed: Optional[int] = None
+    # Constructor keyword arguments, as sorted (name, value) pairs
+    a_kwargs: Tuple[Tuple[str, Any], ...] = ()
+    b_kwargs: Tuple[Tuple[str, Any], ...] = ()
+
+
+def constructor_kwargs(strategy) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Constructor arguments that rebuild `strategy` from its class, as
+    sorted (name, value) pairs. Each __init__ parameter is read back from
+    the instance attribute of the same name; default values are left out,
+    so default instances keep their plain specs (and cache keys).
+    """
+    cls = type(strategy)
+    if cls.__init__ is object.__init__:
+        return ()
+    kwargs = []
+    for p in list(inspect.signature(cls.__init__).parameters.values())[1:]:
+        if p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY):
+            raise ValueError(f"cannot rebuild {cls.__qualname__} from keyword arguments "
+                             f"(its __init__ takes {p})")
+        if not hasattr(strategy, p.name):
+            raise ValueError(f"cannot rebuild {strategy.name!r} from {cls.__qualname__}: "
+                             f"store constructor argument {p.name!r} as self.{p.name}")
+        value = getattr(strategy, p.name)
+        if p.default is p.empty or value != p.default:
+            kwargs.append((p.name, value))
+    return tuple(sorted(kwargs))
+
+
+def match_spec(A, B, cfg: MatchConfig, seed: Optional[int] = None) -> MatchSpec:
+    """
+    Spec replaying strategy instances A (seat A) and B: their classes plus
+    the constructor arguments they were built with.
+    """
+    return MatchSpec(type(A), type(B), cfg, seed, constructor_kwargs(A), constructor_kwargs(B))
+
+
+@dataclass
+class MatchOutcome:
+    """
+    Result of playing one MatchSpec. Profiles are set only when the
+    match config asked for profiling; forfeit ("A"/"B") and timeouts
+    only come from isolated matches.
+    """
+    score_a: float   # int when played, expected value on the analytic path
+    score_b: float
+    profile_a: Optional[StrategyProfile] = None
+    profile_b: Optional[StrategyProfile] = None
+    forfeit: Optional[str] = None
+    timeouts_a: int = 0
+    timeouts_b: int = 0
+
+
+# Strategies without an `rng` attribute draw from the module-level `random`
+# generator, which threads share. Seeded matches involving one hold this
+# lock on the thread executor so each match sees exactly the stream the
+# serial path would give it. Strategies with their own rng need no lock.
+_GLOBAL_RANDOM_LOCK = threading.Lock()
+
+
+def play_match(spec: MatchSpec, observers: Sequence[MatchObserver] = ()) -> MatchOutcome:
+    """
+    Play one match from scratch, or on from its checkpoint if
+    cfg.checkpoint_path holds one saved by this same match.
+    """
+    if spec.seed is not None:
+        random.seed(spec.seed)
+    A = spec.a_cls(**dict(spec.a_kwargs))
+    B = spec.b_cls(**dict(spec.b_kwargs))
+    if spec.cfg.analytic:
+        outcome = _analytic_outcome(A, B, spec.cfg, observers)
+        if outcome is not None:
+            return outcome
+    match = None
+    path = spec.cfg.checkpoint_path
+    if path is not None and os.path.exists(path):
+        match = IteratedMatch.resume(path, observers)
+        if (match.cfg, match.seed, match.A.name, match.B.name) != (spec.cfg, spec.seed, A.name, B.name):
+            match = None  # left over from some other match
+            if spec.seed is not None:
+                random.seed(spec.seed)
+    if match is None:
+        match = IteratedMatch(A, B, spec.cfg, observers, seed=spec.seed)
+    score_a, score_b = match.run()
+    timeouts_a, timeouts_b = match.timeouts
+    return MatchOutcome(score_a, score_b, match.profileA, match.profileB,
+                        match.forfeited, timeouts_a, timeouts_b)
+
+
+def _analytic_outcome(A, B, cfg: MatchConfig,
+                      observers: Sequence[MatchObserver]) -> Optional[MatchOutcome]:
+    # Exact expected scores when both sides are stationary and nothing
+    # needs the actual rounds (traces, profiles, isolation, round observers)
+    if (cfg.verbose or cfg.trace_path or cfg.profile or cfg.profile_memory or cfg.isolate
+            or round_hook(observers) is not None):
+        return None
+    A.reset(N=cfg.N)
+    B.reset(N=cfg.N)
+    p, q = stationary_distribution(A), stationary_distribution(B)
+    if p is None or q is None:
+        return None
+    m = expected_payoff(p, q).over(cfg.rounds)
+    for hook in hooks(observers, "match_start"):
+        hook(A.name, B.name, cfg.N, cfg.rounds)
+    for hook in hooks(observers, "match_end"):
+        hook(A.name, B.name, m.mean_a, m.mean_b)
+    return MatchOutcome(m.mean_a, m.mean_b)
+
+
+def _play_match_threaded(spec: MatchSpec) -> MatchOutcome:
+    if spec.seed is None or (hasattr(spec.a_cls, "rng") and hasattr(spec.b_cls, "rng")):
+        return play_match(spec)
+    with _GLOBAL_RANDOM_LOCK:
+        return play_match(spec)
+
+
+def _match_file(directory: str, a_name: str, b_name: str, ext: str) -> str:
+    safe = lambda name: "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+    return os.path.join(directory, f"{safe(a_name)}_vs_{safe(b_name)}{ext}")
+
+
+def trace_file(trace_dir: str, a_name: str, b_name: str) -> str:
+    """
+    Path of the round trace of a_name (seat A) vs b_name in trace_dir.
+    """
+    return _match_file(trace_dir, a_name, b_name, ".trace")
+
+
+def checkpoint_file(checkpoint_dir: str, a_name: str, b_name: str) -> str:
+    """
+    Path of the in-progress checkpoint of a_name (seat A) vs b_name.
+    """
+    return _match_file(checkpoint_dir, a_name, b_name, ".ckpt")
+
+
+class SpecCheckpoint:
+    """
+    Outcomes of the finished specs of one run_specs call, saved atomically
+    to `path` at most every `interval` seconds and when the run stops
+    (normally or not). The specs are fingerprinted by their cache keys, so
+    a checkpoint is never resumed into a different set of matches.
+    """
+
+    def __init__(self, path: str, specs: List[MatchSpec], resume: bool = True,
+                 interval: float = 30.0) -> None:
+        self.path = path
+        self.interval = interval
+        self.key = hashlib.sha256("".join(spec_key(s) for s in specs).encode()).hexdigest()
+        self.done: Dict[int, MatchOutcome] = {}
+        if resume and os.path.exists(path):
+            saved = load_checkpoint(path, "tournament")
+            if saved["key"] != self.key:
+                raise ValueError(f"{path!r} was saved for a different set of matches")
+            self.done = saved["done"]
+        self._saved_at = time.monotonic()
+
+    def record(self, i: int, outcome: MatchOutcome) -> None:
+        self.done[i] = outcome
+        if time.monotonic() - self._saved_at >= self.interval:
+            self.save()
+
+    def save(self) -> None:
+        save_checkpoint(self.path, "tournament", {"key": self.key, "done": self.done})
+        self._saved_at = time.monotonic()
+
+
+def record_outcome(stats: Dict[str, Stats], a_name: str, b_name: str,
+                   out: MatchOutcome, swapped: bool = False) -> Tuple[float, float]:
+    """
+    Add one match to both players' Stats. swapped: the outcome is from a
+    match where b_name sat in seat A. Returns (a_name's, b_name's) score.
+    """
+    score_a, score_b = out.score_a, out.score_b
+    prof_a, prof_b = out.profile_a, out.profile_b
+    timeouts_a, timeouts_b = out.timeouts_a, out.timeouts_b
+    forfeit = out.forfeit
+    if swapped:
+        score_a, score_b = score_b, score_a
+        prof_a, prof_b = prof_b, prof_a
+        timeouts_a, timeouts_b = timeouts_b, timeouts_a
+        forfeit = {"A": "B", "B": "A"}.get(forfeit)
+    sa, sb = stats[a_name], stats[b_name]
+    if prof_a is not None:
+        sa.profile.merge(prof_a)
+    if prof_b is not None:
+        sb.profile.merge(prof_b)
+    sa.timeouts += timeouts_a
+    sb.timeouts += timeouts_b
+    sa.points_for += score_a
+    sa.points_against += score_b
+    sa.matches += 1
+
+    sb.points_for += score_b
+    sb.points_against += score_a
+    sb.matches += 1
+
+    if forfeit == "A":
+        sa.forfeits += 1
+        sa.losses += 1
+        sb.wins += 1
+    elif forfeit == "B":
+        sb.forfeits += 1
+        sb.losses += 1
+        sa.wins += 1
+    elif score_a > score_b:
+        sa.wins += 1
+        sb.losses += 1
+    elif score_a < score_b:
+        sb.wins += 1
+        sa.losses += 1
+    else:
+        sa.draws += 1
+        sb.draws += 1
+    return score_a, score_b
+
+
+EXECUTORS = ("serial", "process", "thread")
+
+
+class SpecExecutor(Protocol):
+    """
+    Plays specs somewhere other than the built-in executors (e.g. on
+    remote hosts: tournament_distributed.Coordinator).
+    """
+
+    def map(self, specs: List[MatchSpec]) -> Iterator[MatchOutcome]:
+        """
+        Outcomes of all specs, yielded in spec order.
+        """
+        ...
+
+
+# An EXECUTORS name or a SpecExecutor object
+Executor = Union[str, SpecExecutor]
+
+
+def run_specs(
+    specs: List[MatchSpec],
+    executor: Executor = "serial",
+    workers: Optional[int] = None,
+    cache: Optional[MatchCache] = None,
+    observers: Sequence[MatchObserver] = (),
+    on_outcome: Optional[Callable[[int, MatchOutcome, bool], None]] = None,
+    checkpoint: Optional[SpecCheckpoint] = None,
+) -> List[MatchOutcome]:
+    """
+    Play every spec and return the outcomes in spec order.
+
+    executor: "serial" (this process), "process" (process pool),
+    "thread" (thread pool) or a SpecExecutor; workers defaults to the
+    pool's own default.
+    With a cache, seeded specs already in it are not re-simulated
+    (profiling, tracing and isolated runs skip the cache: cached results
+    carry no timings, forfeits or timeouts, and write no trace).
+
+    observers are attached to every match played by the serial executor
+    (other executors play matches out of process). on_outcome(i, outcome,
+    live) is called as each outcome arrives, in spec order; live is True
+    when the observers already saw that match being played.
+
+    With a checkpoint, specs it already holds are not played again and
+    every new outcome is recorded into it.
+    """
+    if checkpoint is not None:
+        done = checkpoint.done
+        todo = [i for i in range(len(specs)) if i not in done]
+        if on_outcome is not None:
+            for i in sorted(done):
+                on_outcome(i, done[i], False)
+
+        def report(j: int, out: MatchOutcome, live: bool) -> None:
+            checkpoint.record(todo[j], out)
+            if on_outcome is not None:
+                on_outcome(todo[j], out, live)
+
+        try:
+            fresh = run_specs([specs[i] for i in todo], executor, workers, cache, observers, report)
+        finally:
+            checkpoint.save()
+        results = dict(done)
+        results.update(zip(todo, fresh))
+        return [results[i] for i in range(len(specs))]
+
+    if cache is None or any(s.cfg.profile or s.cfg.profile_memory or s.cfg.trace_path
+                            or s.cfg.isolate for s in specs):
+        return _execute(specs, executor, workers, observers, on_outcome)
+
+    results: Dict[int, MatchOutcome] = {
+        i: MatchOutcome(sa, sb) for i, (sa, sb) in cache.get_many(specs).items()
+    }
+    todo = [i for i in range(len(specs)) if i not in results]
+    if on_outcome is not None:
+        for i in sorted(results):
+            on_outcome(i, results[i], False)
+        report = lambda j, out, live: on_outcome(todo[j], out, live)
+    else:
+        report = None
+    fresh = _execute([specs[i] for i in todo], executor, workers, observers, report)
+    cache.put_many([specs[i] for i in todo], [(o.score_a, o.score_b) for o in fresh])
+    results.update(zip(todo, fresh))
+    return [results[i] for i in range(len(specs))]
+
+
+def _execute(
+    specs: List[MatchSpec],
+    executor: Executor,
+    workers: Optional[int],
+    observers: Sequence[MatchObserver] = (),
+    on_outcome: Optional[Callable[[int, MatchOutcome, bool], None]] = None,
+) -> List[MatchOutcome]:
+    if not specs:
+        return []
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r} (expected one of {EXECUTORS})")
+    outcomes: List[MatchOutcome] = []
+    if executor == "serial":
+        live = bool(observers)
+        for spec in specs:
+            outcomes.append(play_match(spec, observers))
+            if on_outcome is not None:
+                on_outcome(len(outcomes) - 1, outcomes[-1], live)
+        return outcomes
+    for out in _pool_outcomes(specs, executor, workers):
+        outcomes.append(out)
+        if on_outcome is not None:
+            on_outcome(len(outcomes) - 1, out, False)
+    return outcomes
+
+
+def _pool_outcomes(specs: List[MatchSpec], executor: Executor, workers: Optional[int]):
+    # Outcomes from a process or thread pool, yielded in spec order as they finish
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if not isinstance(executor, str):
+        yield from executor.map(specs)
+    elif executor == "process":
+        n = workers or os.cpu_count() or 1
+        chunk = max(1, len(specs) // (4 * n))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(play_match, specs, chunksize=chunk)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(_play_match_threaded, specs)
+
+
 def run_tournament(
     strategies,
     cfg: MatchConfig,
     play_both_orders: bool = False,
+    *,
+    executor: Executor = "serial",
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    cache: Optional[MatchCache] = None,
+    profile: bool = False,
+    profile_memory: bool = False,
+    trace_dir: Optional[str] = None,
+    observers: Sequence[MatchObserver] = (),
+    checkpoint_dir: Optional[str] = None,
+    resume: bool = False,
 ) -> Tuple[Dict[str, Stats], Dict[Tuple[str, str], Tuple[float, float]]]:
+    """
+    Round-robin: every pair of strategies plays one match (two with
+    play_both_orders, one per seat order).
+
+    Matches are independent, so they can run on a process or thread pool
+    (see run_specs). Results are merged in a fixed order; with a seed,
+    each match is seeded from (seed, seat order) and the output is
+    bit-identical across executors. Seeded matches can also be looked up
+    in / stored to a MatchCache, so re-running a sweep only simulates
+    pairings whose strategy source (or settings) changed.
+
+    profile / profile_memory record the time (and peak memory) spent
+    inside each strategy into Stats.profile; see print_profile_leaderboard.
+
+    trace_dir writes one round trace per match there, named
+    "<A>_vs_<B>.trace" in seat order (see shared.trace).
+
+    observers get tournament start/progress/end and every match's end
+    event; with the serial executor they also see match start and rounds.
+
+    With cfg.analytic, pairings of two stationary strategies are scored
+    with their exact expected payoffs instead of being played.
+
+    checkpoint_dir keeps the finished pairings in "tournament.ckpt" there
+    and, when cfg.checkpoint_every is set, one "<A>_vs_<B>.ckpt" per match
+    in progress. With resume=True an interrupted run continues from those
+    files; for a seeded tournament the result is identical to an
+    uninterrupted run. Without resume, old checkpoints are discarded.
+    A run that completes removes its checkpoints (matches remove their own
+    as they finish).
+    """
     stats: Dict[str, Stats] = {s.name: Stats() for s in strategies}
     h2h: Dict[Tuple[str, str], Tuple[float, float]] = {}
 
-    def record(a_name: str, b_name: str, score_a: float, score_b: float):
-        sa, sb = stats[a_name], stats[b_name]
-        sa.points_for += score_a
-        sa.points_against += score_b
-        sa.matches += 1
-
-        sb.points_for += score_b
-        sb.points_against += score_a
-        sb.matches += 1
-
-        if score_a > score_b:
-            sa.wins += 1
-            sb.losses += 1
-        elif score_a < score_b:
-            sb.wins += 1
-            sa.losses += 1
-        else:
-            sa.draws += 1
-            sb.draws += 1
-
-    for S1, S2 in combinations(strategies, 2):
-        A = type(S1)()
-        B = type(S2)()
-        local_cfg = MatchConfig(N=cfg.N, rounds=cfg.rounds, verbose=False)
-
-        scoreA, scoreB = IteratedMatch(A, B, local_cfg).run()
-        record(A.name, B.name, scoreA, scoreB)
-        h2h[(A.name, B.name)] = (scoreA, scoreB)
+    local_cfg = replace(cfg, verbose=False,
+                        profile=profile or cfg.profile,
+                        profile_memory=profile_memory or cfg.profile_memory)
+
+    if trace_dir is not None:
+        os.makedirs(trace_dir, exist_ok=True)
+
+    def spec(S1, S2) -> MatchSpec:
+        match_seed = None if seed is None else derive_seed(seed, S1.name, S2.name)
+        match_cfg = local_cfg
+        if trace_dir is not None:
+            match_cfg = replace(match_cfg, trace_path=trace_file(trace_dir, S1.name, S2.name))
+        if checkpoint_dir is not None and cfg.checkpoint_every:
+            match_cfg = replace(match_cfg, checkpoint_path=checkpoint_file(checkpoint_dir, S1.name, S2.name))
+        elif cfg.checkpoint_path is not None:  # one path cannot serve every match
+            match_cfg = replace(match_cfg, checkpoint_path=None)
+        return match_spec(S1, S2, match_cfg, match_seed)
+
+    pairs = list(combinations(strategies, 2))
+    specs: List[MatchSpec] = []
+    seats: List[Tuple[str, str]] = []
+    for S1, S2 in pairs:
+        specs.append(spec(S1, S2))
+        seats.append((S1.name, S2.name))
+        if play_both_orders:
+            specs.append(spec(S2, S1))
+            seats.append((S2.name, S1.name))
+
+    on_outcome = None
+    if observers:
+        for hook in hooks(observers, "tournament_start"):
+            hook(len(specs))
+        end_hooks = hooks(observers, "match_end")
+        progress_hooks = hooks(observers, "tournament_progress")
+        done = 0
+
+        def on_outcome(i: int, out: MatchOutcome, live: bool) -> None:
+            nonlocal done
+            done += 1
+            if not live:
+                for hook in end_hooks:
+                    hook(*seats[i], out.score_a, out.score_b)
+            for hook in progress_hooks:
+                hook(done, len(specs))
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        path = os.path.join(checkpoint_dir, "tournament.ckpt")
+        if not resume:
+            remove_checkpoint(path)
+            for s in specs:
+                if s.cfg.checkpoint_path is not None:
+                    remove_checkpoint(s.cfg.checkpoint_path)
+        checkpoint = SpecCheckpoint(path, specs, resume)
+
+    outcomes = iter(run_specs(specs, executor, workers, cache, observers, on_outcome, checkpoint))
+    if checkpoint is not None:  # every pairing finished: nothing left to resume
+        remove_checkpoint(checkpoint.path)
+
+    for S1, S2 in pairs:
+        scoreA, scoreB = record_outcome(stats, S1.name, S2.name, next(outcomes))
+        h2h[(S1.name, S2.name)] = (scoreA, scoreB)
 
         if play_both_orders:
-            A2 = type(S1)()
-            B2 = type(S2)()
-            scoreB2, scoreA2 = IteratedMatch(B2, A2, local_cfg).run()
-            record(A2.name, B2.name, scoreA2, scoreB2)
+            scoreA2, scoreB2 = record_outcome(stats, S1.name, S2.name, next(outcomes), swapped=True)
 
-            prev = h2h[(A.name, B.name)]
-            h2h[(A.name, B.name)] = (prev[0] + scoreA2, prev[1] + scoreB2)
+            prev = h2h[(S1.name, S2.name)]
+            h2h[(S1.name, S2.name)] = (prev[0] + scoreA2, prev[1] + scoreB2)
 
+    for hook in hooks(observers, "tournament_end"):
+        hook(stats)
     return stats, h2h
 
 
-def print_leaderboard(stats: Dict[str, Stats]):
+def print_leaderboard(stats: Dict[str, Stats], order: Optional[List[str]] = None):
+    """
+    One row per strategy, by wins, then point difference, then points
+    scored; or in the given `order` (e.g. a knockout's final ranking).
+    """
     rows = []
     for name, st in stats.items():
         rows.append((name, st.wins, st.draws, st.losses, st.matches, st.points_for, st.points_against, st.diff))
 
-    rows.sort(key=lambda r: (r[1], r[7], r[5]), reverse=True)
+    if order is None:
+        rows.sort(key=lambda r: (r[1], r[7], r[5]), reverse=True)
+    else:
+        rank = {name: i for i, name in enumerate(order)}
+        rows.sort(key=lambda r: rank[r[0]])
+
+    # Forfeit/timeout columns only appear when an isolated run produced some
+    isolated = any(st.forfeits or st.timeouts for st in stats.values())
+    extra_head = f" {'F':>3} {'TO':>5}" if isolated else ""
 
     print("\n=== Leaderboard ===")
-    print(f"{'Strategy':<18} {'W':>3} {'D':>3} {'L':>3} {'M':>3} {'PF':>10} {'PA':>10} {'DIFF':>10}")
+    print(f"{'Strategy':<18} {'W':>3} {'D':>3} {'L':>3} {'M':>3} {'PF':>10} {'PA':>10} {'DIFF':>10}" + extra_head)
     for (name, w, d, l, m, pf, pa, diff) in rows:
-        print(f"{name:<18} {w:>3} {d:>3} {l:>3} {m:>3} {pf:>10.2f} {pa:>10.2f} {diff:>10.2f}")
+        extra = f" {stats[name].forfeits:>3} {stats[name].timeouts:>5}" if isolated else ""
+        print(f"{name:<18} {w:>3} {d:>3} {l:>3} {m:>3} {pf:>10.2f} {pa:>10.2f} {diff:>10.2f}" + extra)
+
+
+def print_profile_leaderboard(stats: Dict[str, Stats]):
+    """
+    Where the time went: per strategy, time inside reset/act/on_result
+    (from run_tournament(..., profile=True)), slowest first.
+    """
+    total = sum(st.profile.total_wall for st in stats.values()) or 1.0
+    rows = sorted(stats.items(), key=lambda kv: kv[1].profile.total_wall, reverse=True)
+
+    print("\n=== Time per strategy ===")
+    print(f"{'Strategy':<18} {'WALL s':>9} {'CPU s':>9} {'SHARE':>6} "
+          f"{'RESET ms':>9} {'ACT us':>8} {'RESULT us':>10} {'PEAK KiB':>9}")
+    for name, st in rows:
+        p = st.profile
+        act_us = 1e6 * p.act_wall / p.act_calls if p.act_calls else 0.0
+        res_us = 1e6 * p.result_wall / p.result_calls if p.result_calls else 0.0
+        print(f"{name:<18} {p.total_wall:>9.3f} {p.total_cpu:>9.3f} {100 * p.total_wall / total:>5.1f}% "
+              f"{1e3 * p.reset_wall:>9.3f} {act_us:>8.2f} {res_us:>10.2f} {p.peak_mem / 1024:>9.1f}")
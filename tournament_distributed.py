@@ -0,0 +1,444 @@
+"""
+Multi-host match execution: a Coordinator hands match specs to worker
+processes over TCP and yields their outcomes in spec order, so it can be
+passed as the executor of run_specs / run_tournament (and everything
+built on them). Stats and h2h are aggregated exactly as for local runs.
+
+Every worker host needs the same checkout (strategies are sent by
+reference and imported on the worker; workers refuse specs whose code
+hash differs from the coordinator's).
+
+    # on each worker host
+    python tournament_distributed.py worker coordinator-host:5000 --processes 8
+    # on the coordinator (or in Python: run_tournament(..., executor=Coordinator(...)))
+    python tournament_distributed.py coordinator --bind 0.0.0.0:5000 --seed 1
+
+Both sides read the shared secret from CAS_AUTHKEY (or --authkey).
+"""
+import argparse
+import os
+import socket
+import threading
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import Client, Listener
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from shared.match import MatchConfig
+from tournament_cache import spec_key
+from tournament_core import MatchOutcome, MatchSpec, play_match
+
+AUTHKEY_ENV = "CAS_AUTHKEY"
+
+# Messages are tuples, first item the kind:
+#   worker -> coordinator: ("hello", name), ("ping",),
+#       ("result", job, i, outcome), ("error", job, i, traceback),
+#       ("stolen", job, [i, ...])
+#   coordinator -> worker: ("task", job, i, key, spec), ("steal", job, k),
+#       ("cancel", job), ("stop",)
+
+
+def _authkey(authkey: Optional[bytes]) -> bytes:
+    key = authkey if authkey is not None else os.environ.get(AUTHKEY_ENV, "").encode()
+    if not key:
+        raise ValueError(f"no authkey: pass one or set {AUTHKEY_ENV} (workers run whatever they are sent)")
+    return key
+
+
+def parse_address(text: str) -> Tuple[str, int]:
+    """
+    "host:port" -> (host, port).
+    """
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class _Worker:
+    # Coordinator-side view of one connected worker
+
+    def __init__(self, conn, name: str) -> None:
+        self.conn = conn
+        self.name = name
+        self.outstanding: Set[int] = set()  # specs sent and not yet returned
+        self.stealing = False
+        self.alive = True
+        self.last_seen = time.monotonic()
+        self._send_lock = threading.Lock()
+
+    def send(self, msg) -> bool:
+        try:
+            with self._send_lock:
+                self.conn.send(msg)
+            return True
+        except (OSError, EOFError, ValueError):
+            return False
+
+
+class _Job:
+    # One map() call: the specs, what is left to hand out, what came back
+
+    def __init__(self, job_id: int, specs: List[MatchSpec]) -> None:
+        self.id = job_id
+        self.specs = specs
+        self.keys = [spec_key(s) for s in specs]
+        self.pending: Deque[int] = deque(range(len(specs)))
+        self.results: Dict[int, MatchOutcome] = {}
+        self.attempts = [0] * len(specs)
+        self.error: Optional[BaseException] = None
+
+
+class Coordinator:
+    """
+    Serves match specs to workers connecting over TCP (serve_worker) and
+    yields the outcomes in spec order: a SpecExecutor for run_specs and
+    run_tournament.
+
+    Workers may join or leave at any time. Each keeps up to `prefetch`
+    specs queued; once there is nothing left to hand out, an idle worker
+    steals half of the unstarted specs of the busiest one. The specs of a
+    worker that disconnects, or sends nothing (not even its heartbeat)
+    for `timeout` seconds, are handed out again, at most `max_attempts`
+    times each. A spec that raises on a worker fails the run: the error
+    would be the same anywhere.
+
+    Connections are authenticated with `authkey` (HMAC challenge), but
+    specs and outcomes are pickles: only connect hosts you trust.
+    """
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), authkey: Optional[bytes] = None,
+                 *, prefetch: int = 2, timeout: float = 60.0, max_attempts: int = 3) -> None:
+        self._listener = Listener(tuple(address), authkey=_authkey(authkey))
+        self.prefetch = max(1, prefetch)
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self._cond = threading.Condition()
+        self._workers: List[_Worker] = []
+        self._job: Optional[_Job] = None
+        self._job_ids = 0
+        self._closed = False
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._listener.address
+
+    @property
+    def workers(self) -> List[str]:
+        with self._cond:
+            return [w.name for w in self._workers]
+
+    def wait_for_workers(self, n: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until at least n workers are connected (False on timeout).
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._workers) >= n, timeout)
+
+    def map(self, specs: Sequence[MatchSpec]) -> Iterator[MatchOutcome]:
+        """
+        Play all specs on the workers; outcomes are yielded in spec order.
+        """
+        with self._cond:
+            if self._job is not None:
+                raise RuntimeError("a Coordinator runs one map() at a time")
+            self._job_ids += 1
+            job = self._job = _Job(self._job_ids, list(specs))
+            self._dispatch()
+        try:
+            for i in range(len(job.specs)):
+                with self._cond:
+                    while i not in job.results and job.error is None:
+                        self._cond.wait(timeout=1.0)
+                        self._expire_silent()
+                    if job.error is not None:
+                        raise job.error
+                    out = job.results[i]
+                yield out
+        finally:
+            with self._cond:
+                self._job = None
+                for w in self._workers:
+                    w.outstanding.clear()
+                    w.stealing = False
+                    w.send(("cancel", job.id))
+
+    def close(self) -> None:
+        """
+        Tell the workers to exit and stop accepting new ones.
+        """
+        with self._cond:
+            self._closed = True
+            workers = list(self._workers)
+        for w in workers:
+            w.send(("stop",))
+        self._listener.close()
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Connection handling (one thread per worker)
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except Exception:  # bad handshake, or the listener was closed
+                if self._closed:
+                    return
+                continue
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        try:
+            _, name = conn.recv()  # ("hello", name)
+        except Exception:
+            conn.close()
+            return
+        worker = _Worker(conn, name)
+        with self._cond:
+            self._workers.append(worker)
+            self._dispatch()
+            self._cond.notify_all()
+        try:
+            while True:
+                msg = conn.recv()
+                with self._cond:
+                    worker.last_seen = time.monotonic()
+                    if not worker.alive:  # timed out, but it was only slow
+                        worker.alive = True
+                        self._workers.append(worker)
+                    self._handle(worker, msg)
+        except (EOFError, OSError):
+            pass
+        finally:
+            with self._cond:
+                self._drop(worker)
+            conn.close()
+
+    # Scheduling (all called with self._cond held)
+
+    def _handle(self, worker: _Worker, msg) -> None:
+        kind = msg[0]
+        job = self._job
+        if kind == "ping" or job is None or msg[1] != job.id:
+            return  # heartbeat, or left over from an earlier map()
+        if kind == "result":
+            _, _, i, out = msg
+            worker.outstanding.discard(i)
+            job.results.setdefault(i, out)
+            self._cond.notify_all()
+        elif kind == "error":
+            _, _, i, tb = msg
+            job.error = RuntimeError(f"match {i} failed on worker {worker.name}:\n{tb}")
+            self._cond.notify_all()
+        elif kind == "stolen":
+            worker.stealing = False
+            for i in msg[2]:
+                worker.outstanding.discard(i)
+                job.pending.appendleft(i)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        job = self._job
+        if job is None or job.error is not None:
+            return
+        while job.pending:
+            free = [w for w in self._workers if len(w.outstanding) < self.prefetch]
+            if not free:
+                return
+            w = min(free, key=lambda w: len(w.outstanding))
+            i = job.pending.popleft()
+            if i in job.results:
+                continue
+            w.outstanding.add(i)
+            if not w.send(("task", job.id, i, job.keys[i], job.specs[i])):
+                self._drop(w)
+                return
+        # Nothing left to hand out: idle workers take work from the busiest
+        for idle in [w for w in self._workers if not w.outstanding]:
+            victim = max(self._workers, key=lambda w: len(w.outstanding))
+            if len(victim.outstanding) < 2 or victim.stealing:
+                return
+            victim.stealing = True
+            victim.send(("steal", job.id, len(victim.outstanding) // 2))
+
+    def _drop(self, worker: _Worker) -> None:
+        # Forget a worker (idempotent) and hand its specs out again
+        if not worker.alive:
+            return
+        worker.alive = False
+        self._workers.remove(worker)
+        job = self._job
+        if job is not None:
+            for i in sorted(worker.outstanding, reverse=True):
+                if i in job.results:
+                    continue
+                job.attempts[i] += 1
+                if job.attempts[i] >= self.max_attempts:
+                    job.error = RuntimeError(f"match {i} lost {job.attempts[i]} times "
+                                             f"(last on worker {worker.name})")
+                job.pending.appendleft(i)
+        worker.outstanding.clear()
+        self._dispatch()
+        self._cond.notify_all()
+
+    def _expire_silent(self) -> None:
+        # A worker whose heartbeat stopped is treated as lost; if it comes
+        # back to life, it rejoins and its late results still count
+        now = time.monotonic()
+        for w in list(self._workers):
+            if now - w.last_seen > self.timeout:
+                self._drop(w)
+
+
+def serve_worker(address: Tuple[str, int], authkey: Optional[bytes] = None, *,
+                 name: Optional[str] = None, heartbeat: float = 5.0) -> int:
+    """
+    Connect to a Coordinator and play the specs it sends, one at a time,
+    until it says stop or the connection drops. Returns the number of
+    matches played.
+    """
+    conn = Client(tuple(address), authkey=_authkey(authkey))
+    send_lock = threading.Lock()
+    cond = threading.Condition()
+    queue: Deque[tuple] = deque()  # (job, i, key, spec), not yet started
+    stopping = False
+    played = 0
+
+    def send(msg) -> None:
+        with send_lock:
+            conn.send(msg)
+
+    def run() -> None:
+        nonlocal played
+        while True:
+            with cond:
+                cond.wait_for(lambda: queue or stopping)
+                if stopping:
+                    return
+                job_id, i, key, spec = queue.popleft()
+            try:
+                if spec_key(spec) != key:
+                    raise RuntimeError("strategy or engine code on this worker differs from the coordinator's")
+                msg = ("result", job_id, i, play_match(spec))
+                played += 1
+            except Exception:
+                msg = ("error", job_id, i, traceback.format_exc())
+            try:
+                send(msg)
+            except (OSError, ValueError):
+                return
+
+    def beat() -> None:
+        while True:
+            with cond:
+                if cond.wait_for(lambda: stopping, timeout=heartbeat):
+                    return
+            try:
+                send(("ping",))
+            except (OSError, ValueError):
+                return
+
+    send(("hello", name or f"{socket.gethostname()}:{os.getpid()}"))
+    for target in (run, beat):
+        threading.Thread(target=target, daemon=True).start()
+    try:
+        while True:
+            msg = conn.recv()
+            kind = msg[0]
+            if kind == "task":
+                with cond:
+                    queue.append(msg[1:])
+                    cond.notify_all()
+            elif kind == "steal":
+                _, job_id, k = msg
+                with cond:
+                    taken = []
+                    while queue and len(taken) < k and queue[-1][0] == job_id:
+                        taken.append(queue.pop()[1])
+                send(("stolen", job_id, taken))
+            elif kind == "cancel":
+                with cond:
+                    keep = [task for task in queue if task[0] != msg[1]]
+                    queue.clear()
+                    queue.extend(keep)
+            elif kind == "stop":
+                break
+    except (EOFError, OSError):
+        pass
+    finally:
+        with cond:
+            stopping = True
+            cond.notify_all()
+        conn.close()
+    return played
+
+
+def start_local_workers(address: Tuple[str, int], n: int, authkey: Optional[bytes] = None) -> list:
+    """
+    n worker processes on this machine, connected to `address` (to test
+    the distributed path, or to let the coordinator's host play too).
+    """
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("spawn")  # the coordinator runs threads: don't fork it
+    key = _authkey(authkey)
+    procs = []
+    for k in range(n):
+        p = ctx.Process(target=serve_worker, args=(address, key),
+                        kwargs={"name": f"{socket.gethostname()}-local{k}"}, daemon=True)
+        p.start()
+        procs.append(p)
+    return procs
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("--authkey", help=f"shared secret (default: ${AUTHKEY_ENV})")
+    sub = p.add_subparsers(dest="role", required=True)
+
+    w = sub.add_parser("worker", help="play matches for a coordinator")
+    w.add_argument("address", help="coordinator host:port")
+    w.add_argument("--processes", type=int, default=1, help="worker processes on this host")
+
+    c = sub.add_parser("coordinator", help="run a round-robin on connected workers")
+    c.add_argument("patterns", nargs="*", help="strategy names or patterns (default: team strategies)")
+    c.add_argument("--bind", default="0.0.0.0:5000", help="host:port to listen on")
+    c.add_argument("--local-workers", type=int, default=0, help="also start this many workers here")
+    c.add_argument("--min-workers", type=int, default=1, help="wait for this many workers first")
+    c.add_argument("--N", type=int, default=100)
+    c.add_argument("--rounds", type=int, default=1000)
+    c.add_argument("--seed", type=int, default=1)
+    c.add_argument("--both-orders", action="store_true")
+    args = p.parse_args(argv)
+    authkey = args.authkey.encode() if args.authkey else None
+
+    if args.role == "worker":
+        address = parse_address(args.address)
+        if args.processes == 1:
+            serve_worker(address, authkey)
+        else:
+            for proc in start_local_workers(address, args.processes, authkey):
+                proc.join()
+        return
+
+    from tournament_core import make_strategies, print_leaderboard, run_tournament
+
+    with Coordinator(parse_address(args.bind), authkey) as coord:
+        host, port = coord.address
+        if args.local_workers:
+            start_local_workers(("127.0.0.1", port), args.local_workers, authkey)
+        print(f"Coordinator on {host}:{port}, waiting for {args.min_workers} worker(s)")
+        coord.wait_for_workers(args.min_workers)
+        cfg = MatchConfig(N=args.N, rounds=args.rounds, verbose=False)
+        stats, _ = run_tournament(make_strategies(*args.patterns), cfg, args.both_orders,
+                                  executor=coord, seed=args.seed)
+        print_leaderboard(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from shared.match import MatchConfig
+from shared.rng import derive_seed
+from tournament_cache import MatchCache
+from tournament_core import Executor, MatchSpec, match_spec, run_specs
+
+
+def payoff_matrix(
+    strategies,
+    cfg: MatchConfig,
+    *,
+    seed: int,
+    reps: int = 1,
+    self_play: bool = True,
+    executor: Executor = "serial",
+    workers: Optional[int] = None,
+    cache: Optional[MatchCache] = None,
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Expected per-round payoff M[i, j] of strategy i against strategy j,
+    averaged over `reps` seeded matches in each seat order.
+
+    Matches are only played here, once; the dynamics below work on M
+    alone. With a cache, rebuilding M for a grown pool only plays the new
+    pairings. Without self_play the diagonal is 0.
+    """
+    names = [s.name for s in strategies]
+    local_cfg = replace(cfg, verbose=False)
+    S = len(strategies)
+    cells: List[Tuple[int, int]] = []
+    specs: List[MatchSpec] = []
+    for i in range(S):
+        for j in range(i if self_play else i + 1, S):
+            A, B = strategies[i], strategies[j]
+            for r in range(reps):
+                specs.append(match_spec(A, B, local_cfg, derive_seed(seed, A.name, B.name, r)))
+                cells.append((i, j))
+                if i != j:  # self-play already fills both seats of M[i, i]
+                    specs.append(match_spec(B, A, local_cfg, derive_seed(seed, B.name, A.name, r)))
+                    cells.append((j, i))
+
+    total = np.zeros((S, S))
+    count = np.zeros((S, S))
+    for (i, j), out in zip(cells, run_specs(specs, executor, workers, cache)):
+        total[i, j] += out.score_a
+        total[j, i] += out.score_b
+        count[i, j] += 1
+        count[j, i] += 1
+    M = np.divide(total, count * cfg.rounds, out=np.zeros((S, S)), where=count > 0)
+    return names, M
+
+
+def matrix_from_h2h(
+    h2h: Dict[Tuple[str, str], Tuple[float, float]],
+    names: List[str],
+    rounds: int,
+) -> np.ndarray:
+    """
+    Per-round payoff matrix from run_tournament's head-to-head totals
+    (divide by `rounds`, times 2 if the tournament played both orders).
+    h2h has no self-play, so the diagonal is 0.
+    """
+    index = {n: i for i, n in enumerate(names)}
+    M = np.zeros((len(names), len(names)))
+    for (a, b), (sa, sb) in h2h.items():
+        M[index[a], index[b]] = sa / rounds
+        M[index[b], index[a]] = sb / rounds
+    return M
+
+
+def replicator(
+    M: np.ndarray,
+    x0: Optional[np.ndarray] = None,
+    generations: int = 1000,
+    background: float = 0.0,
+    record_every: int = 1,
+) -> np.ndarray:
+    """
+    Discrete replicator dynamics x'_i = x_i (f_i + background) / mean fitness,
+    with f = M x.
+
+    x0 has shape (S,) or (P, S) for P populations evolved at once
+    (default: uniform). Returns the trajectory recorded every
+    `record_every` generations, shape (T, S) or (T, P, S).
+    Payoffs here are non-negative, so background >= 0 keeps fitness valid.
+    """
+    S = M.shape[0]
+    x = np.full(S, 1.0 / S) if x0 is None else np.asarray(x0, dtype=float)
+    x = x / x.sum(axis=-1, keepdims=True)
+    traj = [x]
+    for g in range(1, generations + 1):
+        fit = x @ M.T + background
+        x = x * fit
+        x = x / x.sum(axis=-1, keepdims=True)
+        if g % record_every == 0:
+            traj.append(x)
+    return np.stack(traj)
+
+
+def _fitness(M: np.ndarray, counts: np.ndarray, selection: float) -> np.ndarray:
+    # Mean payoff of each type against the rest of the population (no
+    # self-interaction), mapped to fitness 1 - w + w * payoff
+    n = counts.sum(axis=-1, keepdims=True)
+    payoff = (counts @ M.T - np.diagonal(M)) / np.maximum(n - 1, 1)
+    return 1.0 - selection + selection * payoff
+
+
+def _pick(rng: np.random.Generator, weights: np.ndarray) -> np.ndarray:
+    # One categorical draw per row of `weights`
+    cum = np.cumsum(weights, axis=-1)
+    u = rng.random(weights.shape[0]) * cum[:, -1]
+    return (cum <= u[:, None]).sum(axis=-1).clip(max=weights.shape[1] - 1)
+
+
+def moran(
+    M: np.ndarray,
+    counts0: np.ndarray,
+    steps: int,
+    *,
+    runs: int = 1,
+    selection: float = 1.0,
+    mutation: float = 0.0,
+    seed: Optional[int] = None,
+    record_every: int = 1,
+) -> np.ndarray:
+    """
+    Frequency-dependent Moran process: each step one individual is
+    chosen to reproduce (proportional to fitness) and one, uniformly at
+    random, to die. With mutation, the offspring is a uniformly random
+    type instead with that probability.
+
+    `runs` independent populations evolve in lockstep as array rows.
+    counts0 has shape (S,) (same start for every run) or (runs, S).
+    Returns counts recorded every `record_every` steps, shape (T, runs, S).
+    """
+    rng = np.random.default_rng(seed)
+    S = M.shape[0]
+    counts = np.broadcast_to(np.asarray(counts0, dtype=np.int64), (runs, S)).copy()
+    rows = np.arange(runs)
+    traj = [counts.copy()]
+    for step in range(1, steps + 1):
+        fit = _fitness(M, counts, selection) * counts
+        born = _pick(rng, np.maximum(fit, 0.0))
+        if mutation:
+            mutate = rng.random(runs) < mutation
+            born = np.where(mutate, rng.integers(0, S, runs), born)
+        dies = _pick(rng, counts.astype(float))
+        counts[rows, born] += 1
+        counts[rows, dies] -= 1
+        if step % record_every == 0:
+            traj.append(counts.copy())
+    return np.stack(traj)
+
+
+def wright_fisher(
+    M: np.ndarray,
+    counts0: np.ndarray,
+    generations: int,
+    *,
+    runs: int = 1,
+    selection: float = 1.0,
+    mutation: float = 0.0,
+    seed: Optional[int] = None,
+    record_every: int = 1,
+) -> np.ndarray:
+    """
+    Wright-Fisher process: every generation the whole population is
+    resampled (multinomially) in proportion to count * fitness, so one
+    generation of any population size is a single vectorized draw.
+    Same shapes and parameters as moran().
+    """
+    rng = np.random.default_rng(seed)
+    S = M.shape[0]
+    counts = np.broadcast_to(np.asarray(counts0, dtype=np.int64), (runs, S)).copy()
+    n = counts.sum(axis=-1)
+    traj = [counts.copy()]
+    for g in range(1, generations + 1):
+        w = np.maximum(_fitness(M, counts, selection), 0.0) * counts
+        p = w / w.sum(axis=-1, keepdims=True)
+        if mutation:
+            p = (1 - mutation) * p + mutation / S
+        counts = rng.multinomial(n, p)
+        if g % record_every == 0:
+            traj.append(counts.copy())
+    return np.stack(traj)
+
+
+def print_population(names: List[str], x: np.ndarray, title: str = "Population") -> None:
+    """
+    Final shares (x of shape (S,), counts or frequencies), largest first.
+    """
+    x = np.asarray(x, dtype=float)
+    share = x / x.sum()
+    print(f"\n=== {title} ===")
+    print(f"{'Strategy':<18} {'SHARE':>7}")
+    for i in np.argsort(-share):
+        print(f"{names[i]:<18} {100 * share[i]:>6.2f}%")
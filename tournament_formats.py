@@ -0,0 +1,339 @@
+import math
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from shared.match import MatchConfig
+from shared.observers import MatchObserver
+from shared.rng import derive_seed
+from tournament_cache import MatchCache
+from tournament_core import (Executor, MatchOutcome, MatchSpec, Stats, print_leaderboard,
+                             match_spec, record_outcome, run_specs, run_tournament)
+
+FORMATS = ("round_robin", "swiss", "single_elim", "double_elim")
+
+
+@dataclass(frozen=True)
+class TournamentSpec:
+    """
+    Which format to run and its knobs.
+
+    swiss_rounds: rounds of a Swiss event (default ceil(log2 S)).
+    max_replays: knockout matches that end in a draw are replayed with
+    fresh seeds up to this many times; after that the better seed advances.
+    """
+    format: str = "round_robin"
+    play_both_orders: bool = False
+    swiss_rounds: Optional[int] = None
+    max_replays: int = 2
+
+
+@dataclass
+class EventResult:
+    """
+    Outcome of an event: Stats per strategy and head-to-head scores as
+    from run_tournament, plus the final ranking (best first).
+    """
+    stats: Dict[str, Stats]
+    h2h: Dict[Tuple[str, str], Tuple[float, float]]
+    standings: List[str]
+    # Swiss only: match points (win 1, draw 0.5, bye 1) and Buchholz
+    points: Dict[str, float] = field(default_factory=dict)
+    buchholz: Dict[str, float] = field(default_factory=dict)
+
+
+class _Event:
+    """
+    Plays rounds of pairings and records them into one Stats/h2h table.
+    A pairing is one match, or two with play_both_orders.
+    """
+
+    def __init__(self, strategies, cfg: MatchConfig, spec: TournamentSpec, seed: Optional[int],
+                 executor: Executor, workers: Optional[int], cache: Optional[MatchCache],
+                 observers: Sequence[MatchObserver]) -> None:
+        self.by_name = {s.name: s for s in strategies}
+        self.index = {s.name: i for i, s in enumerate(strategies)}
+        self.cfg = replace(cfg, verbose=False)
+        self.spec = spec
+        self.seed = seed
+        self.executor = executor
+        self.workers = workers
+        self.cache = cache
+        self.observers = observers
+        self.stats: Dict[str, Stats] = {s.name: Stats() for s in strategies}
+        self.h2h: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self.meetings: Dict[Tuple[str, str], int] = {}  # per pair, in seat order
+
+    def _seed(self, a: str, b: str, meeting: int) -> Optional[int]:
+        if self.seed is None:
+            return None
+        # First meetings use the round-robin seeds, so results are shared with it
+        if meeting == 0:
+            return derive_seed(self.seed, a, b)
+        return derive_seed(self.seed, a, b, meeting)
+
+    def play(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """
+        Play every pairing at once; returns the first player's result per
+        pairing: 1 win, 0.5 draw, 0 loss.
+        """
+        specs: List[MatchSpec] = []
+        seats: List[Tuple[str, str]] = []
+        for a, b in pairs:
+            # Seat the earlier-listed strategy as A, as run_tournament does
+            x, y = (a, b) if self.index[a] < self.index[b] else (b, a)
+            meeting = self.meetings.get((x, y), 0)
+            self.meetings[(x, y)] = meeting + 1
+            X, Y = self.by_name[x], self.by_name[y]
+            specs.append(match_spec(X, Y, self.cfg, self._seed(x, y, meeting)))
+            seats.append((x, y))
+            if self.spec.play_both_orders:
+                specs.append(match_spec(Y, X, self.cfg, self._seed(y, x, meeting)))
+                seats.append((y, x))
+
+        outcomes = iter(run_specs(specs, self.executor, self.workers, self.cache, self.observers))
+        seat_of = iter(seats)
+        results = []
+        for a, b in pairs:
+            total_a = total_b = 0
+            leg_points = 0.0
+            legs = 2 if self.spec.play_both_orders else 1
+            for _ in range(legs):
+                out = next(outcomes)
+                swapped = next(seat_of)[0] != a
+                sa, sb = record_outcome(self.stats, a, b, out, swapped)
+                total_a += sa
+                total_b += sb
+                leg_points += _leg_result(out, swapped)
+            self._add_h2h(a, b, total_a, total_b)
+
+            if leg_points * 2 != legs:
+                results.append(1.0 if leg_points * 2 > legs else 0.0)
+            else:
+                results.append(1.0 if total_a > total_b else 0.0 if total_a < total_b else 0.5)
+        return results
+
+    def _add_h2h(self, a: str, b: str, sa: float, sb: float) -> None:
+        # Keyed in input order, like run_tournament's h2h
+        if self.index[a] > self.index[b]:
+            a, b, sa, sb = b, a, sb, sa
+        prev = self.h2h.get((a, b), (0, 0))
+        self.h2h[(a, b)] = (prev[0] + sa, prev[1] + sb)
+
+    def knockout(self, pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Play knockout pairings (first name = better seed); draws are
+        replayed. Returns (winner, loser) per pairing.
+        """
+        results = self.play(pairs)
+        for _ in range(self.spec.max_replays):
+            drawn = [i for i, r in enumerate(results) if r == 0.5]
+            if not drawn:
+                break
+            for i, r in zip(drawn, self.play([pairs[i] for i in drawn])):
+                results[i] = r
+        return [(b, a) if r == 0.0 else (a, b) for (a, b), r in zip(pairs, results)]
+
+
+def _leg_result(out: MatchOutcome, swapped: bool) -> float:
+    # Result of one match for the pairing's first player
+    if out.forfeit is not None:
+        r = 0.0 if out.forfeit == "A" else 1.0
+    else:
+        r = 1.0 if out.score_a > out.score_b else 0.0 if out.score_a < out.score_b else 0.5
+    return 1.0 - r if swapped else r
+
+
+def run_event(
+    strategies,
+    cfg: MatchConfig,
+    spec: TournamentSpec = TournamentSpec(),
+    *,
+    seed: Optional[int] = None,
+    executor: Executor = "serial",
+    workers: Optional[int] = None,
+    cache: Optional[MatchCache] = None,
+    observers: Sequence[MatchObserver] = (),
+) -> EventResult:
+    """
+    Run a tournament in the format given by `spec`. Strategies are seeded
+    by their order in `strategies` (first = top seed).
+
+    - round_robin: run_tournament, O(S^2) matches.
+    - swiss: ceil(log2 S) rounds (or spec.swiss_rounds) of S/2 matches,
+      each pairing players with equal or nearest match points who have
+      not met yet; O(S log S) matches. Ranked by points, then Buchholz
+      (sum of opponents' points), then score difference.
+    - single_elim: seeded bracket, byes for the top seeds; S - 1 matches.
+    - double_elim: winners and losers brackets, out after two losses,
+      grand final with a reset if the losers-bracket player wins it;
+      at most 2S matches.
+
+    Each round's matches run together through run_specs, so executor,
+    workers and cache work as in run_tournament. First meetings reuse the
+    round-robin match seeds.
+    """
+    if spec.format not in FORMATS:
+        raise ValueError(f"Unknown format {spec.format!r} (expected one of {FORMATS})")
+    if spec.format == "round_robin":
+        stats, h2h = run_tournament(strategies, cfg, spec.play_both_orders, executor=executor,
+                                    workers=workers, seed=seed, cache=cache, observers=observers)
+        return EventResult(stats, h2h, _by_record(stats))
+
+    event = _Event(strategies, cfg, spec, seed, executor, workers, cache, observers)
+    names = [s.name for s in strategies]
+    if spec.format == "swiss":
+        return _swiss(event, names)
+    if spec.format == "single_elim":
+        return _single_elim(event, names)
+    return _double_elim(event, names)
+
+
+def _by_record(stats: Dict[str, Stats]) -> List[str]:
+    # Same order as print_leaderboard
+    return sorted(stats, key=lambda n: (stats[n].wins, stats[n].diff, stats[n].points_for), reverse=True)
+
+
+def _swiss(event: _Event, names: List[str]) -> EventResult:
+    rounds = event.spec.swiss_rounds
+    if rounds is None:
+        rounds = max(1, math.ceil(math.log2(max(2, len(names)))))
+    seed_rank = {n: i for i, n in enumerate(names)}
+    points = {n: 0.0 for n in names}
+    opponents: Dict[str, List[str]] = {n: [] for n in names}
+    had_bye = set()
+
+    for _ in range(rounds):
+        order = sorted(names, key=lambda n: (-points[n], seed_rank[n]))
+        if len(order) % 2:
+            # Bye (worth a win) to the lowest-ranked player without one yet
+            bye = next((n for n in reversed(order) if n not in had_bye), order[-1])
+            had_bye.add(bye)
+            points[bye] += 1.0
+            order.remove(bye)
+
+        pairs: List[Tuple[str, str]] = []
+        while order:
+            a = order.pop(0)
+            # Nearest-ranked opponent not met yet, else the nearest one
+            j = next((j for j, b in enumerate(order) if b not in opponents[a]), 0)
+            b = order.pop(j)
+            pairs.append((a, b))
+            opponents[a].append(b)
+            opponents[b].append(a)
+
+        for (a, b), r in zip(pairs, event.play(pairs)):
+            points[a] += r
+            points[b] += 1.0 - r
+
+    buchholz = {n: sum(points[o] for o in opponents[n]) for n in names}
+    stats = event.stats
+    standings = sorted(names, key=lambda n: (-points[n], -buchholz[n], -stats[n].diff, seed_rank[n]))
+    return EventResult(stats, event.h2h, standings, points, buchholz)
+
+
+def _bracket(n: int) -> List[Optional[int]]:
+    """
+    Seed indices in bracket order for n entrants, padded with None (byes)
+    to a power of two, so that seeds 1 and 2 can only meet in the final.
+    """
+    size = 1
+    while size < n:
+        size *= 2
+    order = [0]
+    while len(order) < size:
+        m = 2 * len(order)
+        order = [x for s in order for x in (s, m - 1 - s)]
+    return [s if s < n else None for s in order]
+
+
+def _pair_round(entrants: List[Optional[str]], seed_rank: Dict[str, int]):
+    """
+    Pair neighbours; returns (pairs with the better seed first, players
+    advancing on a bye).
+    """
+    pairs, byes = [], []
+    for i in range(0, len(entrants) - 1, 2):
+        a, b = entrants[i], entrants[i + 1]
+        if a is None or b is None:
+            if a is not None or b is not None:
+                byes.append(a if a is not None else b)
+            continue
+        pairs.append((a, b) if seed_rank[a] < seed_rank[b] else (b, a))
+    if len(entrants) % 2:
+        byes.append(entrants[-1])
+    return pairs, byes
+
+
+def _single_elim(event: _Event, names: List[str]) -> EventResult:
+    seed_rank = {n: i for i, n in enumerate(names)}
+    alive: List[Optional[str]] = [None if s is None else names[s] for s in _bracket(len(names))]
+    out_round: Dict[str, int] = {}
+    rnd = 0
+    while len(alive) > 1:
+        pairs, _ = _pair_round(alive, seed_rank)
+        winners = {w for w, _ in event.knockout(pairs)}
+        for a, b in pairs:
+            out_round[b if a in winners else a] = rnd
+        # Keep bracket order for the next round
+        nxt: List[Optional[str]] = []
+        for i in range(0, len(alive), 2):
+            a, b = alive[i], alive[i + 1]
+            nxt.append(a if a is not None and (b is None or a in winners) else b)
+        alive = nxt
+        rnd += 1
+    champion = alive[0]
+    if champion is not None:
+        out_round[champion] = rnd
+    standings = sorted(names, key=lambda n: (-out_round.get(n, -1), seed_rank[n]))
+    return EventResult(event.stats, event.h2h, standings)
+
+
+def _double_elim(event: _Event, names: List[str]) -> EventResult:
+    seed_rank = {n: i for i, n in enumerate(names)}
+    winners = [names[s] for s in _bracket(len(names)) if s is not None]
+    # Each drop-down goes to the back of the losers bracket, in round order
+    losers: List[str] = []
+    eliminated: List[str] = []  # worst first
+
+    def order(group: List[str]) -> List[str]:
+        # Pair best remaining seed with worst, like the first bracket round
+        by_seed = sorted(group, key=seed_rank.__getitem__)
+        return [by_seed[s] for s in _bracket(len(by_seed)) if s is not None]
+
+    while len(winners) + len(losers) > 1:
+        if len(winners) == 1 and len(losers) == 1:
+            # Grand final; a losers-bracket win forces a reset match
+            (champ, other), = event.knockout([(winners[0], losers[0])])
+            if champ == losers[0]:
+                (champ, other), = event.knockout([(champ, winners[0])])
+            eliminated.append(other)
+            winners, losers = [champ], []
+            break
+
+        dropped: List[str] = []
+        if len(winners) > 1:
+            pairs, byes = _pair_round(order(winners), seed_rank)
+            results = event.knockout(pairs)
+            winners = order([w for w, _ in results] + byes)
+            dropped = [l for _, l in results]
+
+        pool = losers + dropped
+        if len(pool) > 1:
+            pairs, byes = _pair_round(order(pool), seed_rank)
+            results = event.knockout(pairs)
+            out = sorted((l for _, l in results), key=seed_rank.__getitem__, reverse=True)
+            eliminated.extend(out)
+            losers = [w for w, _ in results] + byes
+        else:
+            losers = pool
+
+    champion = (winners + losers)[0]
+    standings = [champion] + eliminated[::-1]
+    return EventResult(event.stats, event.h2h, standings)
+
+
+def print_standings(result: EventResult) -> None:
+    """
+    Leaderboard in the event's own ranking order.
+    """
+    print_leaderboard(result.stats, order=result.standings)
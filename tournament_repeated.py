@@ -0,0 +1,284 @@
+import math
+from dataclasses import dataclass, field, replace
+from itertools import combinations
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+from shared.match import MatchConfig
+from shared.rng import derive_seed
+from tournament_cache import MatchCache
+from tournament_core import Executor, MatchSpec, match_spec, run_specs
+
+
+def _z(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(mean: float, n: int, z: float) -> Tuple[float, float]:
+    """
+    Wilson score interval for a rate in [0, 1] observed over n trials.
+    """
+    if n == 0:
+        return (0.0, 1.0)
+    denom = 1 + z * z / n
+    center = (mean + z * z / (2 * n)) / denom
+    half = z * math.sqrt(mean * (1 - mean) / n + z * z / (4 * n * n)) / denom
+    # The interval always contains mean; min/max only absorb rounding
+    return (max(0.0, min(mean, center - half)), min(1.0, max(mean, center + half)))
+
+
+def mean_interval(values: List[float], z: float) -> Tuple[float, float]:
+    """
+    Normal-approximation interval for the mean of `values`.
+    """
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return (mean, mean)
+    var = sum((v - mean) ** 2 for v in values) / (n - 1)
+    half = z * math.sqrt(var / n)
+    return (mean - half, mean + half)
+
+
+@dataclass
+class PairingSummary:
+    """
+    Repetitions of one pairing, counted from A's point of view.
+
+    The win rate is A's share of the decisive repetitions: a draw is no
+    evidence for either side, so it is left out of the binomial (sign
+    test) and reported separately as `draws`.
+    """
+    a_name: str
+    b_name: str
+    scores_a: List[float] = field(default_factory=list)
+    scores_b: List[float] = field(default_factory=list)
+    # +1 A settled as better, -1 B settled as better, 0 undecided
+    verdict: int = 0
+    confidence: float = 0.95
+    # Most points one side can score in a repetition (bounds the points
+    # interval when every repetition scored the same)
+    max_score: float = 0.0
+
+    @property
+    def reps(self) -> int:
+        return len(self.scores_a)
+
+    @property
+    def wins(self) -> int:
+        return sum(a > b for a, b in zip(self.scores_a, self.scores_b))
+
+    @property
+    def losses(self) -> int:
+        return sum(a < b for a, b in zip(self.scores_a, self.scores_b))
+
+    @property
+    def draws(self) -> int:
+        return self.reps - self.wins - self.losses
+
+    @property
+    def decisive(self) -> int:
+        return self.reps - self.draws
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Share of decisive repetitions A won (0.5 if every one was drawn).
+        """
+        return self.wins / self.decisive if self.decisive else 0.5
+
+    @property
+    def win_rate_ci(self) -> Tuple[float, float]:
+        return wilson_interval(self.win_rate, self.decisive, _z(self.confidence))
+
+    @property
+    def mean_diff(self) -> float:
+        return (sum(self.scores_a) - sum(self.scores_b)) / self.reps
+
+    @property
+    def mean_diff_ci(self) -> Tuple[float, float]:
+        diffs = [a - b for a, b in zip(self.scores_a, self.scores_b)]
+        return mean_interval(diffs, _z(self.confidence))
+
+
+@dataclass
+class RepeatedStats:
+    """
+    Per-strategy summary over all its pairings.
+
+    Means are averages of the per-pairing means, so pairings that stopped
+    early weigh as much as ones that ran to max_reps.
+    wins/losses/undecided count pairings by their sequential verdict;
+    draws counts drawn repetitions (left out of the win rates).
+    """
+    wins: int = 0
+    losses: int = 0
+    undecided: int = 0
+    reps: int = 0
+    draws: int = 0
+    win_rate: float = 0.0
+    win_rate_ci: Tuple[float, float] = (0.0, 0.0)
+    points: float = 0.0
+    points_ci: Tuple[float, float] = (0.0, 0.0)
+
+
+def run_repeated_tournament(
+    strategies,
+    cfg: MatchConfig,
+    *,
+    seed: int,
+    min_reps: int = 5,
+    max_reps: int = 100,
+    batch: int = 5,
+    confidence: float = 0.95,
+    play_both_orders: bool = False,
+    executor: Executor = "serial",
+    workers: Optional[int] = None,
+    cache: Optional[MatchCache] = None,
+) -> Tuple[Dict[str, RepeatedStats], Dict[Tuple[str, str], PairingSummary]]:
+    """
+    Round-robin where each pairing is repeated with independent seeds
+    until its winner is statistically settled or max_reps is reached.
+
+    After min_reps, every `batch` repetitions the pairing's win rate over
+    its decisive repetitions is tested against 0.5 with a Wilson interval
+    (a sign test: draws carry no information on who is better, so they
+    are dropped from n and pairings that only draw stay undecided until
+    max_reps). The per-look error is
+    Bonferroni-split over all planned looks, so the chance of ever
+    settling a pairing wrongly stays below 1 - confidence.
+    Reported intervals use the plain (unadjusted) confidence level.
+
+    Repetition r of a pairing uses the seed derive_seed(seed, A, B, r),
+    so results do not depend on scheduling, batch size or executor.
+    """
+    if not 1 <= min_reps <= max_reps:
+        raise ValueError("need 1 <= min_reps <= max_reps")
+    local_cfg = replace(cfg, verbose=False)
+    looks = 1 + math.ceil((max_reps - min_reps) / batch)
+    z_look = _z(1 - (1 - confidence) / looks)
+
+    # A round pays at most N - 1 (the lower of two different bids)
+    max_score = (cfg.N - 1) * cfg.rounds * (2 if play_both_orders else 1)
+    pairs = list(combinations(strategies, 2))
+    summaries = {
+        (S1.name, S2.name): PairingSummary(S1.name, S2.name, confidence=confidence, max_score=max_score)
+        for S1, S2 in pairs
+    }
+    active = list(pairs)
+
+    while active:
+        specs: List[MatchSpec] = []
+        plan: List[Tuple[Tuple[str, str], int]] = []
+        for S1, S2 in active:
+            summary = summaries[(S1.name, S2.name)]
+            target = min_reps if summary.reps == 0 else min(max_reps, summary.reps + batch)
+            for r in range(summary.reps, target):
+                specs.append(match_spec(S1, S2, local_cfg, derive_seed(seed, S1.name, S2.name, r)))
+                if play_both_orders:
+                    specs.append(match_spec(S2, S1, local_cfg, derive_seed(seed, S2.name, S1.name, r)))
+                plan.append(((S1.name, S2.name), r))
+
+        outcomes = iter(run_specs(specs, executor, workers, cache))
+        for key, _r in plan:
+            out = next(outcomes)
+            sa, sb = out.score_a, out.score_b
+            if play_both_orders:
+                out = next(outcomes)
+                sa, sb = sa + out.score_b, sb + out.score_a
+            summaries[key].scores_a.append(sa)
+            summaries[key].scores_b.append(sb)
+
+        still_active = []
+        for S1, S2 in active:
+            summary = summaries[(S1.name, S2.name)]
+            lo, hi = wilson_interval(summary.win_rate, summary.decisive, z_look)
+            if lo > 0.5:
+                summary.verdict = 1
+            elif hi < 0.5:
+                summary.verdict = -1
+            elif summary.reps < max_reps:
+                still_active.append((S1, S2))
+        active = still_active
+
+    return _strategy_stats(strategies, summaries, confidence), summaries
+
+
+def _strategy_stats(
+    strategies,
+    summaries: Dict[Tuple[str, str], PairingSummary],
+    confidence: float,
+) -> Dict[str, RepeatedStats]:
+    # A strategy's win rate and points are averages over its pairings, and
+    # its intervals the averages of the per-pairing bounds: Wilson for the
+    # win rate, and for points the normal interval of the mean, or Wilson
+    # on score / max_score when every repetition scored the same. Unlike a
+    # pooled normal approximation, neither collapses to zero width when
+    # the pairings are decided unanimously.
+    z = _z(confidence)
+    per: Dict[str, List[Tuple[float, Tuple[float, float], float, Tuple[float, float], int]]] = {
+        s.name: [] for s in strategies
+    }
+    stats = {s.name: RepeatedStats() for s in strategies}
+
+    for (a, b), sm in summaries.items():
+        wr = sm.win_rate
+        lo, hi = sm.win_rate_ci
+        mean_a, ci_a = _points_interval(sm.scores_a, sm.max_score, z)
+        mean_b, ci_b = _points_interval(sm.scores_b, sm.max_score, z)
+        per[a].append((wr, (lo, hi), mean_a, ci_a, sm.reps))
+        per[b].append((1 - wr, (1 - hi, 1 - lo), mean_b, ci_b, sm.reps))
+
+        sa, sb = stats[a], stats[b]
+        sa.draws += sm.draws
+        sb.draws += sm.draws
+        if sm.verdict > 0:
+            sa.wins += 1
+            sb.losses += 1
+        elif sm.verdict < 0:
+            sb.wins += 1
+            sa.losses += 1
+        else:
+            sa.undecided += 1
+            sb.undecided += 1
+
+    for name, rows in per.items():
+        st = stats[name]
+        k = len(rows)
+        if k == 0:
+            continue
+        st.reps = sum(r[4] for r in rows)
+        st.win_rate = sum(r[0] for r in rows) / k
+        st.win_rate_ci = (sum(r[1][0] for r in rows) / k, sum(r[1][1] for r in rows) / k)
+        st.points = sum(r[2] for r in rows) / k
+        st.points_ci = (sum(r[3][0] for r in rows) / k, sum(r[3][1] for r in rows) / k)
+
+    return stats
+
+
+def _points_interval(scores: List[float], max_score: float, z: float) -> Tuple[float, Tuple[float, float]]:
+    mean = sum(scores) / len(scores)
+    if _sample_var(scores, mean) > 0 or max_score <= 0:
+        return mean, mean_interval(scores, z)
+    lo, hi = wilson_interval(min(1.0, mean / max_score), len(scores), z)
+    return mean, (lo * max_score, hi * max_score)
+
+
+def _sample_var(values: List[float], mean: float) -> float:
+    if len(values) < 2:
+        return 0.0
+    return sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+
+def print_repeated_leaderboard(stats: Dict[str, RepeatedStats]):
+    rows = sorted(stats.items(), key=lambda kv: (kv[1].wins, kv[1].win_rate, kv[1].points), reverse=True)
+
+    print("\n=== Leaderboard (repeated) ===")
+    print(f"{'Strategy':<18} {'W':>3} {'U':>3} {'L':>3} {'REPS':>5} {'DRAWS':>5} "
+          f"{'WIN%':>6} {'WIN% CI':>15} {'PTS/M':>10} {'PTS/M CI':>23}")
+    for name, st in rows:
+        wlo, whi = st.win_rate_ci
+        plo, phi = st.points_ci
+        print(f"{name:<18} {st.wins:>3} {st.undecided:>3} {st.losses:>3} {st.reps:>5} {st.draws:>5} "
+              f"{100 * st.win_rate:>6.1f} {f'[{100 * wlo:.1f}, {100 * whi:.1f}]':>15} "
+              f"{st.points:>10.2f} {f'[{plo:.1f}, {phi:.1f}]':>23}")